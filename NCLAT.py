@@ -1,8 +1,10 @@
 import logging
 import os
 import re
+import threading
 import time
 from datetime import datetime
+from html import unescape
 from typing import Any, Optional
 from urllib.parse import urljoin
 
@@ -33,6 +35,21 @@ DEFAULT_UA = os.getenv(
     "(KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
 )
 
+# Loading the OCR model is expensive; share one instance across captchas.
+_ocr = ddddocr.DdddOcr(show_ad=False)
+
+# A bootstrapped PHPSESSID stays valid for a while; calls that need no captcha
+# reuse one within this window instead of re-running the two-request bootstrap.
+BOOTSTRAP_TTL_SECONDS = int(os.getenv("NCLAT_BOOTSTRAP_TTL_SECONDS", "300"))
+_shared_session: requests.Session | None = None
+_shared_session_at = 0.0
+_shared_session_lock = threading.Lock()
+
+# The srfCaseStatus input tag and its value on the main page.
+# Attribute names are anchored on whitespace so data-name=/data-value= do not match.
+_SRF_INPUT_RE = re.compile(r"""<input\b[^>]*\sname=["']srfCaseStatus["'][^>]*>""", re.IGNORECASE)
+_VALUE_ATTR_RE = re.compile(r"""(?:^|\s)value=["']([^"']*)["']""", re.IGNORECASE)
+
 # Captcha is simple alpha-numeric in most cases.
 CAPTCHA_TOKEN_RE = re.compile(r"[A-Z0-9]+", re.IGNORECASE)
 
@@ -119,6 +136,20 @@ def _new_session() -> requests.Session:
     return session
 
 
+def _extract_srf_token(html: str) -> str | None:
+    """
+    Pull the srfCaseStatus token with a regex scan of the main page, falling
+    back to a full parse only if the markup does not match.
+    """
+    tag = _SRF_INPUT_RE.search(html)
+    value = _VALUE_ATTR_RE.search(tag.group(0)) if tag else None
+    if value:
+        return unescape(value.group(1))
+    soup = BeautifulSoup(html, "lxml")
+    token_el = soup.select_one("form#form_casestatus input[name=srfCaseStatus]")
+    return token_el.get("value") if token_el else None
+
+
 def _bootstrap_case_status(session: requests.Session) -> None:
     """
     The case status page blocks "direct access"; bootstrap by:
@@ -128,9 +159,7 @@ def _bootstrap_case_status(session: requests.Session) -> None:
     resp = session.get(MAIN_URL, timeout=30, headers={"Referer": MAIN_URL})
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    token_el = soup.select_one("form#form_casestatus input[name=srfCaseStatus]")
-    token = token_el.get("value") if token_el else None
+    token = _extract_srf_token(resp.text)
     if not token:
         raise RuntimeError("NCLAT bootstrap failed: missing srfCaseStatus token.")
 
@@ -152,8 +181,28 @@ def _ensure_ready(session: requests.Session) -> None:
     _bootstrap_case_status(session)
 
 
+def _get_shared_session(force_refresh: bool = False) -> requests.Session:
+    """
+    Return a bootstrapped session shared by captcha-free calls (details and
+    order downloads). Searches keep creating their own session because the
+    captcha answer is bound to the PHPSESSID that fetched it.
+    """
+    global _shared_session, _shared_session_at
+    with _shared_session_lock:
+        now = time.monotonic()
+        if (
+            force_refresh
+            or _shared_session is None
+            or now - _shared_session_at > BOOTSTRAP_TTL_SECONDS
+        ):
+            session = _new_session()
+            _bootstrap_case_status(session)
+            _shared_session, _shared_session_at = session, now
+        return _shared_session
+
+
 def _solve_captcha(session: requests.Session) -> str:
-    ocr = ddddocr.DdddOcr(show_ad=False)
+    ocr = _ocr
     # Try a few times; captcha refreshes on each request.
     for attempt in range(8):
         url = f"{CAPTCHA_URL}?_={int(time.time() * 1000)}_{attempt}"
@@ -178,7 +227,7 @@ def _ajax_post(session: requests.Session, data: dict[str, Any]) -> str:
 
 
 def _parse_search_results(html: str, location: str) -> list[dict]:
-    soup = BeautifulSoup(html or "", "html.parser")
+    soup = BeautifulSoup(html or "", "lxml")
     table = soup.find("table")
     if not table:
         return []
@@ -217,7 +266,7 @@ def _parse_search_results(html: str, location: str) -> list[dict]:
 
 
 def _parse_details(html: str, location: str, filing_no: str) -> dict[str, Any]:
-    soup = BeautifulSoup(html or "", "html.parser")
+    soup = BeautifulSoup(html or "", "lxml")
     tables = soup.find_all("table")
 
     title_text = None
@@ -538,23 +587,22 @@ def nclat_get_details(filing_no: str, bench: str | None = None) -> dict[str, Any
         return None
     schema = _normalize_location(bench)
 
-    session = _new_session()
-    html = _ajax_post(
-        session,
-        {
-            "action": "case_status_case_details",
-            "filing_no": filing_no.strip(),
-            "schema_name": schema,
-        },
-    )
+    payload = {
+        "action": "case_status_case_details",
+        "filing_no": filing_no.strip(),
+        "schema_name": schema,
+    }
+    html = _ajax_post(_get_shared_session(), payload)
+    if "Direct access not allowed" in html:
+        # The shared PHPSESSID expired server-side; bootstrap once more.
+        html = _ajax_post(_get_shared_session(force_refresh=True), payload)
     if "Direct access not allowed" in html:
         return None
     return _parse_details(html, location=schema, filing_no=filing_no.strip())
 
 
 def _fetch_order_document(order_url: str, referer: str | None):
-    session = _new_session()
-    _ensure_ready(session)
+    session = _get_shared_session()
     headers: dict[str, str] = {}
     if referer:
         headers["Referer"] = referer
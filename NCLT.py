@@ -1,19 +1,31 @@
+import asyncio
+import bisect
 import hashlib
+import importlib.util
 import json
 import logging
+import operator
 import os
 import re
 import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, AsyncIterator, Iterable, NamedTuple, Optional
 from urllib import parse
 
 import fitz  # PyMuPDF
+import httpx
 import requests
 from bs4 import BeautifulSoup
 from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
                       wait_exponential)
 
+# httpx refuses http2=True without h2, which ships with the httpx[http2]
+# extra; fall back to HTTP/1.1 rather than fail at import.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 from .order_storage import \
     persist_orders_to_storage as _persist_orders_to_storage
 
@@ -24,22 +36,75 @@ BASE_URL = 'https://efiling.nclt.gov.in/'
 SEARCH_URL = 'https://efiling.nclt.gov.in/caseHistoryoptional.drt'
 DETAILS_URL = 'https://efiling.nclt.gov.in/caseHistoryalldetails.drt'
 ORDERS_URL = 'https://efiling.nclt.gov.in/ordersview.drt'
+_ORDERS_PREFIX = f'{ORDERS_URL}?path='
 
 NCLT_GOV_URL = 'https://nclt.gov.in'
 CAUSE_LIST_URL = f'{NCLT_GOV_URL}/all-couse-list'
 
-session = requests.Session()
-session.verify = False
-session.headers = {
-    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:127.0) Gecko/20100101 Firefox/127.0',
-    'Accept': 'application/json, text/javascript, */*; q=0.01',
-    'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate, br',
-    'Content-Type': 'application/json',
-    'Origin': 'https://efiling.nclt.gov.in',
-    'Referer': 'https://efiling.nclt.gov.in/casehistorybeforeloginmenutrue.drt',
-    'X-Requested-With': 'XMLHttpRequest',
-}
+# One pooled client shared by concurrent search/detail calls, multiplexed over
+# HTTP/2 when the httpx[http2] extra is installed. httpx does not follow
+# redirects by default; requests did, and order downloads rely on it.
+session = httpx.Client(
+    http2=_HTTP2,
+    verify=False,
+    follow_redirects=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    headers={
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:127.0) Gecko/20100101 Firefox/127.0',
+        'Accept': 'application/json, text/javascript, */*; q=0.01',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Content-Type': 'application/json',
+        'Origin': 'https://efiling.nclt.gov.in',
+        'Referer': 'https://efiling.nclt.gov.in/casehistorybeforeloginmenutrue.drt',
+        'X-Requested-With': 'XMLHttpRequest',
+    },
+)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket used to pace requests to a single host."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Stay under the efiling host's limit instead of tripping 429/503 and
+# paying for tenacity's exponential backoff.
+_NCLT_LIMIT = _TokenBucket(
+    rate=float(os.getenv("NCLT_MAX_REQUESTS_PER_SECOND", "10")),
+    capacity=int(os.getenv("NCLT_MAX_BURST", "10")),
+)
+
+
+def _session_get(url: str, **kwargs) -> httpx.Response:
+    _NCLT_LIMIT.acquire()
+    return session.get(url, **kwargs)
+
+
+def _session_post(url: str, **kwargs) -> httpx.Response:
+    _NCLT_LIMIT.acquire()
+    return session.post(url, **kwargs)
+
 
 BENCH_MAP = {
     'principal': '10',
@@ -98,10 +163,24 @@ CAUSE_LIST_BENCH_MAP = {
     "registrar nclt court-i": "116",
 }
 
+# httpx's Response.json() raises plain decode errors rather than an
+# httpx.HTTPError, so an HTML or garbled 200 body is listed explicitly to be
+# logged and retried like a failed request.
+_REQUEST_ERRORS = (httpx.HTTPError, json.JSONDecodeError, UnicodeDecodeError)
+
+# Shared retry policy for every NCLT endpoint wrapper.
+_retry = retry(
+    retry=retry_if_exception_type(_REQUEST_ERRORS),
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=2, max=10)
+)
+
 CASE_NO_PATTERN = re.compile(r"\b(?:CP|IA|MA|CA|TCP|TP|C\.P\.)(?:\s*\(\s*IB\s*\))?[\s\./-]*\d+.*?\d{4}\b", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_SERIAL_NO_RE = re.compile(r"\d{1,4}")
 
 def _normalize_case_token(case_no: str) -> str:
-    return re.sub(r"\s+", "", (case_no or "").upper())
+    return _WS_RE.sub("", (case_no or "").upper())
 
 def _case_tail(case_no: str) -> str:
     token = _normalize_case_token(case_no)
@@ -170,41 +249,97 @@ def get_cause_list_bench_id(bench_name):
             return val
     return 'All'
 
-def _standardize_result(item):
+class NcltSearchRow(NamedTuple):
+    """
+    Standardized search hit. Use `._asdict()` where a plain dict is required.
+    """
+    cino: Optional[str]
+    date_of_decision: Optional[str]
+    pet_name: Optional[str]
+    res_name: Optional[str]
+    type_name: Optional[str]
+    filing_no: Optional[str]
+    case_no: Optional[str]
+    bench: Optional[str]
+
+
+@dataclass(slots=True)
+class NcltCaseDetails:
+    """
+    Standardized case details. Use `dataclasses.asdict()` where a plain dict is required.
+    """
+    cin_no: Optional[str]
+    registration_no: Optional[str]
+    filling_no: Optional[str]
+    case_no: Optional[str]
+    registration_date: Optional[str]
+    filing_date: Optional[str]
+    first_listing_date: Optional[str]
+    next_listing_date: Optional[str]
+    last_listing_date: Optional[str]
+    decision_date: Optional[str]
+    court_no: Optional[str]
+    disposal_nature: Optional[str]
+    purpose_next: Optional[str]
+    case_type: Optional[str]
+    pet_name: list[str]
+    res_name: list[str]
+    advocates: Optional[str]
+    judges: Optional[str]
+    bench_name: Optional[str]
+    court_name: Optional[str]
+    history: list[dict] = field(default_factory=list)
+    acts: Optional[str] = None
+    orders: list[dict] = field(default_factory=list)
+    additional_info: dict[str, Any] = field(default_factory=dict)
+    original_json_bytes: Optional[bytes] = None
+
+
+def _standardize_result(item) -> NcltSearchRow:
     """
     Standardize the result from the search list to match the expected output format.
     """
-    return {
-        'cino': item.get('filling_no'), # Using Case No as CINO for now, as usually CINO is unique but here Case No is prominent
-        'date_of_decision': item.get('date_of_filing'),
-        'pet_name': item.get('case_title1'),
-        'res_name': item.get('case_title2'),
-        'type_name': item.get('status'),
-        'filing_no': item.get('filing_no'), # Important for fetching details
-        'case_no': item.get('case_no'),
-        'bench': item.get('bench_location_name')
-    }
+    return NcltSearchRow(
+        cino=item.get('filling_no'), # Using Case No as CINO for now, as usually CINO is unique but here Case No is prominent
+        date_of_decision=item.get('date_of_filing'),
+        pet_name=item.get('case_title1'),
+        res_name=item.get('case_title2'),
+        type_name=item.get('status'),
+        filing_no=item.get('filing_no'), # Important for fetching details
+        case_no=item.get('case_no'),
+        bench=item.get('bench_location_name'),
+    )
+
+def _parse_search_rows(resp: httpx.Response) -> list[NcltSearchRow]:
+    """
+    Standardize the rows of a search response, skipping the JSON decode when
+    a JSON object body cannot contain any hits. Anything else (e.g. an HTML
+    error page) still goes through resp.json(), whose decode error is one of
+    the _REQUEST_ERRORS the retry policy retries.
+    """
+    content = resp.content
+    if content[:1] == b'{' and b'mainpanellist' not in content:
+        return []
+    rows = resp.json().get('mainpanellist')
+    return [_standardize_result(item) for item in rows] if rows else []
+
+# Math captcha shown on the cause-list search form.
+_MATH_CAPTCHA_RE = re.compile(r'(\d+)\s*([\+\-\*])\s*(\d+)')
+_MATH_CAPTCHA_OPS = {'+': operator.add, '-': operator.sub, '*': operator.mul}
 
 def solve_math_captcha(html_content):
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     captcha_sid = soup.find('input', {'name': 'captcha_sid'})['value']
     captcha_token = soup.find('input', {'name': 'captcha_token'})['value']
     
     captcha_text = soup.find('span', {'class': 'field-prefix'}).text
     # Example: "14 + 6 ="
-    match = re.search(r'(\d+)\s*([\+\-\*])\s*(\d+)', captcha_text)
+    match = _MATH_CAPTCHA_RE.search(captcha_text)
     if not match:
         raise ValueError(f"Could not parse math captcha: {captcha_text}")
     
     v1, op, v2 = match.groups()
-    if op == '+':
-        res = int(v1) + int(v2)
-    elif op == '-':
-        res = int(v1) - int(v2)
-    elif op == '*':
-        res = int(v1) * int(v2)
-    else:
-        raise ValueError(f"Unsupported operator: {op}")
+    res = _MATH_CAPTCHA_OPS[op](int(v1), int(v2))
         
     return captcha_sid, captcha_token, str(res)
 
@@ -239,7 +374,7 @@ def fetch_cause_list_pdfs(bench_name: str, date: datetime) -> list[str]:
     resp = requests.get(CAUSE_LIST_URL, params=params, verify=False)
     resp.raise_for_status()
     
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    soup = BeautifulSoup(resp.text, 'lxml')
     table = soup.find('table', {'class': 'views-table'})
     if not table:
         return []
@@ -253,7 +388,7 @@ def fetch_cause_list_pdfs(bench_name: str, date: datetime) -> list[str]:
     return pdf_urls
 
 def _clean_pdf_line(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
+    cleaned = _WS_RE.sub(" ", (text or "")).strip()
     if not cleaned:
         return ""
     if cleaned.startswith("Page ") and " of " in cleaned:
@@ -285,6 +420,28 @@ def _parse_single_cause_list_entry(entry: dict) -> dict:
         "entry_hash": entry_hash,
     }
 
+def _group_words_into_lines(words: list[tuple], tolerance: float = 3.0) -> list[list[dict]]:
+    """
+    Group PyMuPDF words into visual lines ordered top to bottom, left to right.
+    A line takes every word within `tolerance` of its first word's y; the group
+    boundary is found with one bisect over the sorted y values instead of
+    testing each word in turn.
+    """
+    words = sorted(words, key=operator.itemgetter(1, 0))
+    ys = [w[1] for w in words]
+    lines = []
+    start = 0
+    while start < len(words):
+        end = bisect.bisect_right(ys, ys[start] + tolerance, lo=start + 1)
+        lines.append(
+            [
+                {'x': w[0], 'y': w[1], 'text': w[4]}
+                for w in sorted(words[start:end], key=operator.itemgetter(0))
+            ]
+        )
+        start = end
+    return lines
+
 def parse_cause_list_pdf(pdf_path: str) -> list[dict]:
     """
     Parse NCLT cause-list PDF and extract structured entries.
@@ -297,27 +454,7 @@ def parse_cause_list_pdf(pdf_path: str) -> list[dict]:
         for page_idx in range(doc.page_count):
             page = doc[page_idx]
             words = page.get_text("words")
-            # Sort by y then x
-            words.sort(key=lambda w: (w[1], w[0]))
-            
-            lines = []
-            current_y = -1
-            current_line = []
-            
-            for w in words:
-                x0, y0, x1, y1, text = w[:5]
-                if abs(y0 - current_y) > 3:
-                    if current_line:
-                        # Sort by x
-                        current_line.sort(key=lambda it: it['x'])
-                        lines.append(current_line)
-                    current_line = []
-                    current_y = y0
-                current_line.append({'x': x0, 'y': y0, 'text': text})
-            
-            if current_line:
-                current_line.sort(key=lambda it: it['x'])
-                lines.append(current_line)
+            lines = _group_words_into_lines(words)
 
             # Look for table header on this page or previous
             has_header = False
@@ -348,7 +485,7 @@ def parse_cause_list_pdf(pdf_path: str) -> list[dict]:
                 line_text = " ".join(it['text'] for it in line)
                 
                 # Column 1 (Sr. No): x < 80
-                if first_token_x < 80 and re.fullmatch(r'\d{1,4}', line[0]['text']):
+                if first_token_x < 80 and _SERIAL_NO_RE.fullmatch(line[0]['text']):
                     item_no_candidate = line[0]['text']
                 
                 # Column 2 (Case No): 80 <= x < 160
@@ -391,12 +528,8 @@ def find_case_entries(pdf_path: str, case_no: str) -> list[dict]:
             matched.append(entry)
     return matched
 
-@retry(
-    retry=retry_if_exception_type(requests.exceptions.RequestException),
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def nclt_search_by_filing_number(bench, filing_number):
+@_retry
+def nclt_search_by_filing_number(bench, filing_number) -> list[NcltSearchRow]:
     # Note: filing_year is not explicitly used in the filing number search payload of the new site,
     # but the old signature included it. We'll ignore it or check if it's part of filing_number.
     try:
@@ -405,24 +538,16 @@ def nclt_search_by_filing_number(bench, filing_number):
             "i_bench_id": get_bench_id(bench),
             "filing_no": filing_number
         }
-        resp = session.post(SEARCH_URL, json=payload)
+        resp = _session_post(SEARCH_URL, json=payload)
         resp.raise_for_status()
-        data = resp.json()
-        
-        if 'mainpanellist' in data and data['mainpanellist']:
-            return [_standardize_result(item) for item in data['mainpanellist']]
-        return []
+        return _parse_search_rows(resp)
 
-    except requests.exceptions.RequestException as e:
+    except _REQUEST_ERRORS as e:
         logger.error(f"Request failed: {e}")
         raise
 
-@retry(
-    retry=retry_if_exception_type(requests.exceptions.RequestException),
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def nclt_search_by_case_number(bench, case_type, case_number, case_year):
+@_retry
+def nclt_search_by_case_number(bench, case_type, case_number, case_year) -> list[NcltSearchRow]:
     try:
         payload = {
             "wayofselection": "casenumber",
@@ -431,23 +556,15 @@ def nclt_search_by_case_number(bench, case_type, case_number, case_year):
             "case_no": case_number,
             "i_case_year_caseno": case_year
         }
-        resp = session.post(SEARCH_URL, json=payload)
+        resp = _session_post(SEARCH_URL, json=payload)
         resp.raise_for_status()
-        data = resp.json()
-        
-        if 'mainpanellist' in data and data['mainpanellist']:
-            return [_standardize_result(item) for item in data['mainpanellist']]
-        return []
-    except requests.exceptions.RequestException as e:
+        return _parse_search_rows(resp)
+    except _REQUEST_ERRORS as e:
         logger.error(f"Request failed: {e}")
         raise
 
-@retry(
-    retry=retry_if_exception_type(requests.exceptions.RequestException),
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def nclt_search_by_party_name(bench, party_type, party_name, case_year, case_status):
+@_retry
+def nclt_search_by_party_name(bench, party_type, party_name, case_year, case_status) -> list[NcltSearchRow]:
     try:
         payload = {
             "wayofselection": "partyname",
@@ -458,23 +575,15 @@ def nclt_search_by_party_name(bench, party_type, party_name, case_year, case_sta
             "status_party": case_status, # 'P' or 'D' or '0'
             "i_party_search": "E" # Default to Exact, maybe 'W' for wrap?
         }
-        resp = session.post(SEARCH_URL, json=payload)
+        resp = _session_post(SEARCH_URL, json=payload)
         resp.raise_for_status()
-        data = resp.json()
-        
-        if 'mainpanellist' in data and data['mainpanellist']:
-            return [_standardize_result(item) for item in data['mainpanellist']]
-        return []
-    except requests.exceptions.RequestException as e:
+        return _parse_search_rows(resp)
+    except _REQUEST_ERRORS as e:
         logger.error(f"Request failed: {e}")
         raise
 
-@retry(
-    retry=retry_if_exception_type(requests.exceptions.RequestException),
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def nclt_search_by_advocate_name(bench, advocate_name, year):
+@_retry
+def nclt_search_by_advocate_name(bench, advocate_name, year) -> list[NcltSearchRow]:
     try:
         payload = {
             "wayofselection": "advocatename",
@@ -484,24 +593,29 @@ def nclt_search_by_advocate_name(bench, advocate_name, year):
             "bar_council_advocate": "", # Optional
             "i_adv_search": "E"
         }
-        resp = session.post(SEARCH_URL, json=payload)
+        resp = _session_post(SEARCH_URL, json=payload)
         resp.raise_for_status()
-        data = resp.json()
-        
-        if 'mainpanellist' in data and data['mainpanellist']:
-            return [_standardize_result(item) for item in data['mainpanellist']]
-        return []
+        return _parse_search_rows(resp)
 
-    except requests.exceptions.RequestException as e:
+    except _REQUEST_ERRORS as e:
         logger.error(f"Request failed: {e}")
         raise
 
-@retry(
-    retry=retry_if_exception_type(requests.exceptions.RequestException),
-    stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=2, max=10)
-)
-def nclt_get_details(bench, filing_no):
+def _order_url(proc: dict) -> Optional[str]:
+    """Order document URL for a proceeding, or None when it has no encPath."""
+    order_path = proc.get('encPath')
+    if not order_path or order_path == 'NA':
+        return None
+    return _ORDERS_PREFIX + parse.quote(order_path)
+
+@_retry
+def nclt_get_details(bench, filing_no, include_raw=False) -> NcltCaseDetails:
+    """
+    Fetch case details for a filing number.
+
+    The raw response body is only kept (as `original_json_bytes`) when
+    `include_raw` is set; use `decode_original` to parse it on demand.
+    """
     # Bench argument is preserved for compatibility but not strictly needed for the detail fetch 
     # as filing_no is unique global identifier in NCLT usually, or at least the API just needs filing_no.
     try:
@@ -510,7 +624,7 @@ def nclt_get_details(bench, filing_no):
             'flagIA': 'false'
         }
         # The endpoint expects GET
-        resp = session.get(DETAILS_URL, params=params)
+        resp = _session_get(DETAILS_URL, params=params)
         resp.raise_for_status()
         data = resp.json() # It returns JSON
 
@@ -559,22 +673,22 @@ def nclt_get_details(bench, filing_no):
         listing_date = final_status.get('listing_date')
         
         # 4. Orders
-        orders = []
+        # encPath is the 'path' param for ordersview.drt:
+        # https://efiling.nclt.gov.in/ordersview.drt?path={encPath}
         proceedings = data.get('allproceedingdtls') or []
+        orders = []
         for proc in proceedings:
-            order_path = proc.get('encPath') # This is the 'path' param for ordersview.drt
-            # Construct URL: https://efiling.nclt.gov.in/ordersview.drt?path={encPath}
-            order_url = f"{ORDERS_URL}?path={parse.quote(order_path)}" if order_path and order_path != 'NA' else None
-            parsed_order_date = _normalize_order_date(proc.get('order_upload_date'))
-            parsed_listing_date = _normalize_order_date(proc.get('listing_date'))
-            
+            order_url = _order_url(proc)
             orders.append({
-                "date": parsed_order_date or parsed_listing_date or proc.get('order_upload_date') or proc.get('listing_date'),
+                "date": _normalize_order_date(proc.get('order_upload_date'))
+                or _normalize_order_date(proc.get('listing_date'))
+                or proc.get('order_upload_date')
+                or proc.get('listing_date'),
                 "description": f"Listing: {proc.get('listing_date')} | Purpose: {proc.get('purpose')} | Action: {proc.get('today_action')}",
                 "document_url": order_url,
                 "source_document_url": order_url,
                 "listing_date": proc.get('listing_date'),
-                "upload_date": proc.get('order_upload_date')
+                "upload_date": proc.get('order_upload_date'),
             })
             
         # 5. Connected Matters (using IA/MA list or similar)
@@ -589,24 +703,24 @@ def nclt_get_details(bench, filing_no):
             })
             
         # Construct result
-        return {
-            "cin_no": filing_no, # Using filing_no as cin_no for now
-            "registration_no": reg_info.get('registration_no'), # or case_no?
-            "filling_no": filing_no,
-            "case_no": case_no,
-            "registration_date": reg_date,
-            "filing_date": final_status.get('date_of_filing'),
-            "first_listing_date": listing_date,
-            "next_listing_date": None, # Could extract from proceedings
-            "last_listing_date": listing_date,
-            "decision_date": None,
-            "court_no": final_status.get('court_no'),
-            "disposal_nature": None,
-            "purpose_next": None,
-            "case_type": final_status.get('case_type'),
-            "pet_name": pet_names,
-            "res_name": res_names,
-            "advocates": "\n".join(
+        return NcltCaseDetails(
+            cin_no=filing_no, # Using filing_no as cin_no for now
+            registration_no=reg_info.get('registration_no'), # or case_no?
+            filling_no=filing_no,
+            case_no=case_no,
+            registration_date=reg_date,
+            filing_date=final_status.get('date_of_filing'),
+            first_listing_date=listing_date,
+            next_listing_date=None, # Could extract from proceedings
+            last_listing_date=listing_date,
+            decision_date=None,
+            court_no=final_status.get('court_no'),
+            disposal_nature=None,
+            purpose_next=None,
+            case_type=final_status.get('case_type'),
+            pet_name=pet_names,
+            res_name=res_names,
+            advocates="\n".join(
                 [
                     x
                     for x in [
@@ -625,31 +739,58 @@ def nclt_get_details(bench, filing_no):
                 ]
             ).strip()
             or None,
-            "judges": None,
-            "bench_name": bench,
-            "court_name": final_status.get('bench_nature_descr'),
-            "history": [], # Detailed history is in orders/proceedings
-            "acts": None,
-            "orders": orders,
-            "additional_info": {
+            judges=None,
+            bench_name=bench,
+            court_name=final_status.get('bench_nature_descr'),
+            history=[], # Detailed history is in orders/proceedings
+            acts=None,
+            orders=orders,
+            additional_info={
                 "case_status": case_status,
                 "party_name": f"{', '.join(pet_names)} VS {', '.join(res_names)}",
                 "listing_history": proceedings,
                 "ia_ma": ias,
                 "connected_matters": connected,
             },
-            "original_json": data,
-        }
+            original_json_bytes=resp.content if include_raw else None,
+        )
 
-    except requests.exceptions.RequestException as e:
+    except _REQUEST_ERRORS as e:
         logger.error(f"Request failed: {e}")
         raise
 
+async def nclt_bulk_details(
+    bench,
+    rows: Iterable[NcltSearchRow],
+    concurrency: int = 20,
+) -> AsyncIterator[NcltCaseDetails]:
+    """
+    Fetch details for every search row concurrently, yielding each case as soon
+    as it arrives so callers can start persisting orders while the rest load.
+    Rows whose details fail to load are logged and skipped.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(filing_no):
+        async with semaphore:
+            return await asyncio.to_thread(nclt_get_details, bench, filing_no)
+
+    filing_nos = dict.fromkeys(row.filing_no for row in rows if row.filing_no)
+    for future in asyncio.as_completed([_fetch(f) for f in filing_nos]):
+        try:
+            yield await future
+        except Exception as e:
+            logger.error(f"Failed to fetch NCLT details: {e}")
+
+def decode_original(raw: Optional[bytes]) -> Optional[dict]:
+    """Decode `original_json_bytes` from `nclt_get_details` back into a dict."""
+    return json.loads(raw) if raw else None
+
 def _fetch_order_document(order_url: str, referer: str | None):
     headers = session.headers.copy()
     if referer:
         headers["Referer"] = referer
-    return session.get(order_url, timeout=30, headers=headers)
+    return _session_get(order_url, timeout=30, headers=headers)
 
 async def persist_orders_to_storage(
     orders: list[dict] | None,
@@ -669,5 +810,5 @@ if __name__ == '__main__':
     # Case Type 16 is "Company Petition IB(IBC)"
     
     print(nclt_search_by_case_number('ahmedabad', '14', '1', '2026')) 
-    print(json.dumps(nclt_get_details('ahmedabad', '2401105033432025'))) # Use a valid filing number found from search
+    print(json.dumps(asdict(nclt_get_details('ahmedabad', '2401105033432025')))) # Use a valid filing number found from search
     pass
@@ -1,6 +1,12 @@
 import ast
 import asyncio
+import bisect
+import copy
+import hashlib
+import inspect
+import itertools
 from datetime import datetime
+import json
 import logging
 import operator
 import os
@@ -8,15 +14,29 @@ import random
 import re
 import string
 import tempfile
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 import ddddocr
 import fitz
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, Tag
 from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
                       wait_exponential)
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
 try:
     from .order_storage import \
         persist_orders_to_storage as _persist_orders_to_storage
@@ -36,13 +56,21 @@ TOKEN_URL = "https://www.sci.gov.in/case-status-party-name/"
 CAPTCHA_URL = "https://www.sci.gov.in/?_siwp_captcha&id="
 DATA_URL = "https://www.sci.gov.in/wp-admin/admin-ajax.php"
 
+_SCID_RE = re.compile(r'name="scid" value="([^"]*)"')
+_TOKEN_RE = re.compile(r'<input type="hidden" id="tok_([^"]*)"[^>]*?value="([^"]*)"')
+
 ocr = ddddocr.DdddOcr(show_ad=False)
 session = requests.Session()
 session.verify = False
+# Bulk scraping fans out across threads; size the pool so concurrent calls
+# reuse kept-alive connections instead of opening fresh TLS sessions.
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
 BASE_HEADERS = {
     'Accept': 'application/json, text/javascript, */*; q=0.01',
     'Accept-Language': 'zh-CN,zh;q=0.8,zh-TW;q=0.7,zh-HK;q=0.5,en-US;q=0.3,en;q=0.2',
-    'Accept-Encoding': 'gzip, deflate, br, zstd',
+    'Accept-Encoding': 'gzip, deflate',
     'Referer': 'https://www.sci.gov.in/case-status-party-name/',
     'X-Requested-With': 'XMLHttpRequest',
     'Connection': 'keep-alive',
@@ -50,7 +78,6 @@ BASE_HEADERS = {
     'Sec-Fetch-Mode': 'cors',
     'Sec-Fetch-Site': 'same-origin',
     'Priority': 'u=1',
-    'TE': 'trailers'
 }
 
 USER_AGENTS = [
@@ -67,16 +94,34 @@ USER_AGENTS = [
 session.headers.update(BASE_HEADERS)
 
 
+# The shared session keeps its headers fixed after import; the rotating
+# User-Agent is sent per request so threads never mutate session.headers.
+_user_agent = random.choice(USER_AGENTS)
+
+
 def _randomize_user_agent() -> None:
-    session.headers['User-Agent'] = random.choice(USER_AGENTS)
+    global _user_agent
+    _user_agent = random.choice(USER_AGENTS)
 
 
-def _session_get(url: str, **kwargs):
-    _randomize_user_agent()
-    return session.get(url, **kwargs)
+# Rotate the User-Agent every few requests rather than on each one, so the
+# headers stay stable across runs of kept-alive requests.
+USER_AGENT_ROTATE_EVERY = 25
+_request_counter = itertools.count(1)
 
 
-_randomize_user_agent()
+def _session_get(url: str, headers: Optional[dict] = None, **kwargs):
+    if next(_request_counter) % USER_AGENT_ROTATE_EVERY == 0:
+        _randomize_user_agent()
+    request_headers = {"User-Agent": _user_agent}
+    if headers:
+        request_headers.update(headers)
+    return session.get(url, headers=request_headers, **kwargs)
+
+
+def _soup(html: str) -> BeautifulSoup:
+    """Parse an SCI HTML fragment with the C-backed lxml parser."""
+    return BeautifulSoup(html, "lxml")
 
 
 def validate_response(response):
@@ -86,10 +131,14 @@ def validate_response(response):
         response.raise_for_status()
     
     try:
-        return response.json()
+        # Parse the raw bytes directly; skips decoding the body to str first.
+        return _json_loads(response.content)
     except ValueError as e:
         logger.error(f"Failed to parse JSON: {e}")
-        raise
+        # Keep the requests exception type so tenacity still retries bad bodies.
+        raise requests.exceptions.JSONDecodeError(
+            str(e), response.content.decode("utf-8", errors="replace"), 0
+        ) from e
 
 
 def _extract_html_fragment(payload: dict[str, Any]) -> Optional[str]:
@@ -100,8 +149,12 @@ def _extract_html_fragment(payload: dict[str, Any]) -> Optional[str]:
         logger.warning("SCI response did not include an HTML fragment: %s", payload)
         return None
 
+    # Decoded JSON almost always carries the fragment as a plain string.
+    if type(html_fragment) is str:
+        return html_fragment
+
     if isinstance(html_fragment, dict):
-        message = html_fragment.get("message") if isinstance(html_fragment, dict) else html_fragment
+        message = html_fragment.get("message")
         logger.warning(
             "SCI response returned a message instead of HTML: %s",
             message,
@@ -158,27 +211,45 @@ def _extract_order_date(text: Optional[str]) -> Optional[str]:
         return None
 
 
+_CAPTCHA_TRANS = str.maketrans(
+    {
+        " ": None,
+        "=": None,
+        "?": None,
+        "×": "*",
+        "x": "*",
+        "X": "*",
+        "÷": "/",
+        ":": "/",
+        "–": "-",
+        "−": "-",
+    }
+)
+# Deletes every allowed character; anything left over is unsupported.
+_CAPTCHA_ALLOWED_STRIP = str.maketrans("", "", "0123456789+-*/()")
+
+
 def _normalize_captcha_expression(question: str) -> str:
     """Normalize OCR output into an arithmetic expression we can safely evaluate."""
-    expr = question.strip()
-    expr = expr.replace(" ", "")
-    expr = expr.replace("=", "")
-    expr = expr.replace("?", "")
-    expr = expr.replace("×", "*")
-    expr = expr.replace("x", "*")
-    expr = expr.replace("X", "*")
-    expr = expr.replace("÷", "/")
-    expr = expr.replace(":", "/")
-    expr = expr.replace("–", "-")
-    expr = expr.replace("−", "-")
-
-    allowed_chars = set("0123456789+-*/()")
-    if not expr or any(ch not in allowed_chars for ch in expr):
+    expr = question.strip().translate(_CAPTCHA_TRANS)
+
+    if not expr or expr.translate(_CAPTCHA_ALLOWED_STRIP):
         raise ValueError(f"Unsupported captcha expression: {question}")
 
     return expr
 
 
+# Almost every captcha is a single "N op M"; evaluate that shape directly and
+# keep the AST walk for anything more elaborate.
+_SIMPLE_CAPTCHA_RE = re.compile(r"(-?\d+)([+\-*/])(-?\d+)")
+_SIMPLE_CAPTCHA_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
 def _evaluate_captcha(question: str) -> int:
     """Safely evaluate a simple arithmetic captcha expression."""
     expr = _normalize_captcha_expression(question)
@@ -208,7 +279,15 @@ def _evaluate_captcha(question: str) -> int:
             return node.n
         raise ValueError(f"Unsupported captcha node: {ast.dump(node)}")
 
-    result = _eval(ast.parse(expr, mode="eval"))
+    simple = _SIMPLE_CAPTCHA_RE.fullmatch(expr)
+    if simple:
+        left, op, right = simple.groups()
+        try:
+            result = _SIMPLE_CAPTCHA_OPS[op](int(left), int(right))
+        except ZeroDivisionError as exc:
+            raise ValueError(f"Unsupported captcha expression: {question}") from exc
+    else:
+        result = _eval(ast.parse(expr, mode="eval"))
 
     if isinstance(result, int):
         return result
@@ -231,10 +310,13 @@ def init_captcha(max_attempts: int = 3):
     for attempt in range(1, max_attempts + 1):
         token_page = _session_get(TOKEN_URL)
         token_page_text = token_page.text
-        # print('='*20)
-        # print(token_page_text)
-        # print('='*20)
-        captcha_id = token_page_text.split('name="scid" value="')[1].split('"')[0]
+        scid_match = _SCID_RE.search(token_page_text)
+        token_match = _TOKEN_RE.search(token_page_text)
+        if not scid_match or not token_match:
+            raise requests.exceptions.RequestException(
+                "SCI token page did not include captcha fields"
+            )
+        captcha_id = scid_match.group(1)
         captcha_image = _session_get(CAPTCHA_URL + captcha_id).content
         question = ocr.classification(captcha_image)
 
@@ -247,12 +329,7 @@ def init_captcha(max_attempts: int = 3):
             )
             continue
 
-        token_name = token_page_text.split('<input type="hidden" id="tok_')[1].split('"')[0]
-        token_value = (
-            token_page_text.split('<input type="hidden" id="tok_')[1]
-            .split('value="')[1]
-            .split('"')[0]
-        )
+        token_name, token_value = token_match.groups()
         return token_name, token_value, captcha_id, question, answer
 
     logger.error("Failed to solve SCI captcha after %d attempts", max_attempts)
@@ -262,22 +339,105 @@ def init_captcha(max_attempts: int = 3):
 
 
 
+@dataclass
+class _CaptchaCache:
+    token_name: str
+    token_value: str
+    captcha_id: str
+    question: str
+    answer: int
+    expires_at: float
+
+
+# A solved captcha stays valid for a short window, so searches issued close
+# together can share one instead of paying for a page fetch + OCR each time.
+CAPTCHA_TTL_SECONDS = 60
+_captcha_cache: Optional[_CaptchaCache] = None
+_captcha_lock = threading.Lock()
+
+
+def get_captcha(force_refresh: bool = False, rejected_id: Optional[str] = None):
+    """
+    Return a solved captcha, reusing the cached one while it is still fresh.
+
+    `rejected_id` is the id of a captcha the server just refused. A new one is
+    solved only while the cache still holds that id; if another thread has
+    already replaced it, the replacement is returned instead of invalidating it.
+    """
+    global _captcha_cache
+
+    with _captcha_lock:
+        cached = _captcha_cache
+        if (
+            not force_refresh
+            and cached
+            and cached.expires_at > time.monotonic()
+            and (rejected_id is None or cached.captcha_id != rejected_id)
+        ):
+            return (
+                cached.token_name,
+                cached.token_value,
+                cached.captcha_id,
+                cached.question,
+                cached.answer,
+            )
+
+        token_name, token_value, captcha_id, question, answer = init_captcha()
+        _captcha_cache = _CaptchaCache(
+            token_name=token_name,
+            token_value=token_value,
+            captcha_id=captcha_id,
+            question=question,
+            answer=answer,
+            expires_at=time.monotonic() + CAPTCHA_TTL_SECONDS,
+        )
+        return token_name, token_value, captcha_id, question, answer
+
+
+def _is_captcha_rejection(response: dict[str, Any]) -> bool:
+    return not response.get("success") and "captcha" in str(response.get("data", "")).lower()
+
+
+def _captcha_request(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Call the SCI ajax endpoint with a (possibly cached) captcha, re-solving it
+    once if the server rejects the cached one.
+    """
+    rejected_id: Optional[str] = None
+    for _ in range(2):
+        token_name, token_value, captcha_id, _, answer = get_captcha(rejected_id=rejected_id)
+        params = {
+            **data,
+            "scid": captcha_id,
+            "siwp_captcha_value": answer,
+            "tok_" + token_name: token_value,
+        }
+        response = validate_response(_session_get(DATA_URL, params=params))
+        if not _is_captcha_rejection(response):
+            return response
+        rejected_id = captcha_id
+
+    raise requests.exceptions.RequestException("SCI rejected the captcha")
+
 
 def table_to_list(soup):
+    # One walk collects both the header cells and the rows, in document order.
     columns = []
-    for col in soup.find_all("th"):
-        columns.append(col.text.strip())
-
-    rows = soup.find_all("tr")[1:]
+    rows = []
+    for tag in soup.find_all(("th", "tr")):
+        if tag.name == "th":
+            columns.append(tag.get_text().strip())
+        else:
+            rows.append(tag)
 
     results = []
-    for row in rows:
+    for row in rows[1:]:
         cells = row.find_all("td")
 
         if len(cells) < len(columns):
             continue
 
-        row_data = [cell.text.strip() for cell in cells]
+        row_data = [cell.get_text().strip() for cell in cells]
 
         data = dict(zip(columns, row_data))
 
@@ -294,19 +454,66 @@ def table_to_list(soup):
     return results
 
 
+_DETAIL_LABELS = (
+    "Diary Number",
+    "Case Number",
+    "Present/Last Listed On",
+    "Status/Stage",
+    "Category",
+    "Petitioner(s)",
+    "Respondent(s)",
+    "Petitioner Advocate(s)",
+    "Respondent Advocate(s)",
+    "CNR Number",
+)
+
+
+@lru_cache(maxsize=8)
+def _label_pattern(labels: tuple[str, ...]) -> re.Pattern:
+    # Longest first so a label that prefixes another cannot shadow it.
+    return re.compile("|".join(re.escape(label) for label in sorted(labels, key=len, reverse=True)))
+
+
+def _build_label_map(
+    soup: BeautifulSoup, labels: tuple[str, ...] = _DETAIL_LABELS
+) -> dict[str, Tag]:
+    """Map each label to the <td> following its first occurrence in one pass."""
+    pattern = _label_pattern(labels)
+    pending = set(labels)
+    cells: dict[str, Tag] = {}
+    # The combined pattern tests every label in one regex scan per string, and
+    # only strings containing some label come back from find_all.
+    for text in soup.find_all(string=pattern):
+        found = pending.intersection(m.group(0) for m in pattern.finditer(text))
+        if not found:
+            continue
+        pending -= found
+        cell = text.find_next("td")
+        if cell:
+            for label in found:
+                cells[label] = cell
+        if not pending:
+            break
+    return cells
+
+
 def _extract_td_text(
-    soup: BeautifulSoup, label: str, separator: str = " "
+    cells: dict[str, Tag], label: str, separator: str = " "
 ) -> Optional[str]:
     """Return stripped text of the <td> following a label when present."""
-    label_node = soup.find(string=lambda text: text and label in text)
-    if not label_node:
-        return None
-    cell = label_node.find_next("td") if hasattr(label_node, "find_next") else None
+    cell = cells.get(label)
     if not cell:
         return None
     return cell.get_text(separator=separator, strip=True)
 
 
+# Last successful response per (diary_no, diary_year, tab_name), used to skip
+# re-decoding tabs that have not changed between polls.
+TAB_CACHE_MAX_ENTRIES = 3_000
+_tab_cache: "OrderedDict[tuple[str, str, str], tuple[Optional[str], bytes, tuple[Optional[str], dict[str, Any]]]]" = OrderedDict()
+_tab_cache_lock = threading.Lock()
+
+
 def _fetch_case_tab(
     diary_no: str, diary_year: str, tab_name: str
 ) -> tuple[Optional[str], dict[str, Any]]:
@@ -318,7 +525,22 @@ def _fetch_case_tab(
         "action": "get_case_details",
         "es_ajax_request": "1",
     }
-    resp = _session_get(DATA_URL, params=data)
+    cache_key = (str(diary_no), str(diary_year), tab_name)
+    with _tab_cache_lock:
+        cached = _tab_cache.get(cache_key)
+
+    headers = {"If-None-Match": cached[0]} if cached and cached[0] else {}
+    resp = _session_get(DATA_URL, params=data, headers=headers)
+    # Hand out a copy of the cached payload so callers (sci_get_details puts it
+    # in original_json) cannot mutate the cached record.
+    if cached and resp.status_code == 304:
+        return cached[2][0], copy.deepcopy(cached[2][1])
+
+    # The ajax endpoint rarely sends an ETag, so also compare body digests.
+    digest = hashlib.blake2b(resp.content, digest_size=16).digest()
+    if cached and cached[1] == digest:
+        return cached[2][0], copy.deepcopy(cached[2][1])
+
     payload = validate_response(resp)
 
     if not payload.get("success"):
@@ -326,19 +548,53 @@ def _fetch_case_tab(
         return None, payload
 
     html_fragment = _extract_html_fragment(payload)
+    with _tab_cache_lock:
+        _tab_cache[cache_key] = (
+            resp.headers.get("ETag"),
+            digest,
+            (html_fragment, copy.deepcopy(payload)),
+        )
+        _tab_cache.move_to_end(cache_key)
+        while len(_tab_cache) > TAB_CACHE_MAX_ENTRIES:
+            _tab_cache.popitem(last=False)
     return html_fragment, payload
 
 
+def _fetch_case_tab_soup(
+    diary_no: str, diary_year: str, tab_name: str
+) -> tuple[Optional[BeautifulSoup], dict[str, Any]]:
+    """
+    Fetch a case tab and parse it on the calling thread, so when tabs are
+    fetched from a pool each one is parsed while the others are in flight.
+    """
+    html_fragment, payload = _fetch_case_tab(diary_no, diary_year, tab_name)
+    return (_soup(html_fragment) if html_fragment else None), payload
+
+
+def _row_links(row: Tag) -> dict[int, str]:
+    """Map id() of each <td> in a row to the href of its first link, in one select."""
+    links: dict[int, str] = {}
+    for link in row.select("td a[href]"):
+        cell = link.find_parent("td")
+        if cell is not None:
+            links.setdefault(id(cell), link["href"])
+    return links
+
+
+_NON_KEY_CHARS_RE = re.compile(r"[^0-9a-z]+")
+
+
+@lru_cache(maxsize=256)
 def _normalize_key(label: str) -> str:
     """Convert column labels into snake_case keys."""
-    normalized = re.sub(r"[^0-9a-z]+", "_", label.lower())
-    normalized = re.sub(r"_{2,}", "_", normalized)
-    return normalized.strip("_")
+    # "_" is itself outside [0-9a-z], so runs of separators and underscores
+    # collapse to a single "_" in this one pass.
+    return _NON_KEY_CHARS_RE.sub("_", label.lower()).strip("_")
 
 
-def _parse_listing_dates(html_fragment: str) -> list[dict[str, Any]]:
+def _parse_listing_dates(html_fragment: Union[str, Tag]) -> list[dict[str, Any]]:
     """Parse listing dates table into a list of row dictionaries."""
-    soup = BeautifulSoup(html_fragment, "html.parser")
+    soup = html_fragment if isinstance(html_fragment, Tag) else _soup(html_fragment)
     table = soup.find("table")
     if not table:
         return []
@@ -364,36 +620,41 @@ def _parse_listing_dates(html_fragment: str) -> list[dict[str, Any]]:
             continue
 
         row_data: dict[str, Any] = {}
+        links = _row_links(row)
         for idx, cell in enumerate(cells):
             header = headers[idx] if idx < len(headers) else f"column_{idx + 1}"
             key = _normalize_key(header) or f"column_{idx + 1}"
             text_value = cell.get_text(" ", strip=True)
             row_data[key] = text_value
 
-            link = cell.find("a")
-            if link and link.get("href"):
-                row_data[f"{key}_url"] = link.get("href")
+            href = links.get(id(cell))
+            if href:
+                row_data[f"{key}_url"] = href
 
         results.append(row_data)
 
     return results
 
 
-def _parse_judgement_orders(html_fragment: str) -> list[dict[str, Any]]:
+def _parse_judgement_orders(html_fragment: Union[str, Tag]) -> list[dict[str, Any]]:
     """Extract judgment/order documents with date and description."""
-    soup = BeautifulSoup(html_fragment, "html.parser")
+    soup = html_fragment if isinstance(html_fragment, Tag) else _soup(html_fragment)
     rows: list[dict[str, Any]] = []
 
-    for cell in soup.find_all("td"):
-        link = cell.find("a")
-        if not link or not link.get("href"):
+    # Only visit link-bearing cells; most <td>s in the tab have no document.
+    seen_cells: set[int] = set()
+    for link in soup.select("td a[href]"):
+        cell = link.find_parent("td")
+        if not link["href"] or id(cell) in seen_cells:
             continue
+        seen_cells.add(id(cell))
 
         date_text = link.get_text(" ", strip=True)
         full_text = cell.get_text(" ", strip=True)
         extracted_date = _extract_order_date(date_text) or _extract_order_date(full_text)
-        trailing = full_text[len(date_text) :].strip()
-        trailing = trailing.replace("\xa0", " ").strip()
+        # str.strip already treats \xa0 as whitespace, so one strip after the
+        # replace gives the same result as stripping on both sides of it.
+        trailing = full_text[len(date_text) :].replace("\xa0", " ").strip()
         if trailing.startswith("[") and trailing.endswith("]"):
             trailing = trailing[1:-1].strip()
 
@@ -408,36 +669,75 @@ def _parse_judgement_orders(html_fragment: str) -> list[dict[str, Any]]:
     return rows
 
 
+# Search results are stable within a day; serve repeats from memory so a
+# re-loaded case or a retried batch skips the captcha and the request.
+SEARCH_CACHE_TTL_SECONDS = 6 * 3600
+SEARCH_CACHE_MAX_ENTRIES = 5_000
+_search_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cached_search(fn):
+    """
+    Memoize a search by its arguments. Only non-empty results are kept, so a
+    failed or empty search (possibly a transient server error, or a case not
+    indexed yet) is asked again next time.
+    """
+    signature = inspect.signature(fn)
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Bind so positional and keyword spellings of a call share one key.
+        bound = signature.bind(*args, **kwargs)
+        key = (fn.__name__, *(str(value) for value in bound.arguments.values()))
+        with _search_cache_lock:
+            entry = _search_cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                _search_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            if entry:
+                del _search_cache[key]
+
+        result = fn(*args, **kwargs)
+        if result:
+            with _search_cache_lock:
+                _search_cache[key] = (
+                    time.monotonic() + SEARCH_CACHE_TTL_SECONDS,
+                    copy.deepcopy(result),
+                )
+                _search_cache.move_to_end(key)
+                while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                    _search_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+@_cached_search
 @retry(
     retry=retry_if_exception_type(requests.exceptions.RequestException),
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=2, max=10),
 )
 def sci_search_by_diary_number(diary_number, diary_year):
-    token_name, token_value, captcha_id, question, answer = init_captcha()
-
     data = {
         "action": "get_case_status_diary_no",
         "diary_no": diary_number,
         "year": diary_year,
-        "scid": captcha_id,
-        "siwp_captcha_value": answer,
-        "tok_" + token_name: token_value,
         "es_ajax_request": "1",
         "submit": "Search",
         "language": "en",
     }
 
     try:
-        resp = _session_get(DATA_URL, params=data)
-        response = validate_response(resp)
+        response = _captcha_request(data)
 
         if response.get("success"):
             html_fragment = _extract_html_fragment(response)
             if not html_fragment:
                 return []
 
-            soup = BeautifulSoup(html_fragment, "html.parser")
+            soup = _soup(html_fragment)
             return table_to_list(soup)
         else:
             print("Request was unsuccessful.")
@@ -448,39 +748,31 @@ def sci_search_by_diary_number(diary_number, diary_year):
         raise
 
 
+@_cached_search
 @retry(
     retry=retry_if_exception_type(requests.exceptions.RequestException),
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=2, max=10),
 )
 def sci_search_by_case_number(case_type, case_number, case_year):
-    token_name, token_value, captcha_id, question, answer = init_captcha()
     data = {
         "action": "get_case_status_case_no",
         "case_type": case_type,
         "case_no": case_number,
         "year": case_year,
-        "scid": captcha_id,
-        "siwp_captcha_value": answer,
-        "tok_" + token_name: token_value,
         "es_ajax_request": "1",
         "submit": "Search",
         "language": "en",
     }
     try:
-        resp = _session_get(DATA_URL, params=data)
-        # print(resp.text)
-        response = validate_response(resp)
+        response = _captcha_request(data)
         if not response["success"]:
-            if "captcha" in response.get("data", "").lower():
-                #call the function again to retry
-                return sci_search_by_case_number(case_type, case_number, case_year)
             return []
 
         html_fragment = response.get("data", {}).get('resultsHtml',"")
         if not html_fragment:
             return []
-        soup = BeautifulSoup(html_fragment, "html.parser")
+        soup = _soup(html_fragment)
         
 
         return table_to_list(soup)
@@ -490,35 +782,31 @@ def sci_search_by_case_number(case_type, case_number, case_year):
         raise
 
 
+@_cached_search
 @retry(
     retry=retry_if_exception_type(requests.exceptions.RequestException),
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=2, max=10),
 )
 def sci_search_by_aor_code(party_type, aor_code, year, case_status):
-    token_name, token_value, captcha_id, question, answer = init_captcha()
     data = {
         "action": "get_case_status_aor_code",
         "party_type": party_type,
         "aor_code": aor_code,
         "year": year,
         "case_status": case_status,
-        "scid": captcha_id,
-        "siwp_captcha_value": answer,
-        "tok_" + token_name: token_value,
         "es_ajax_request": "1",
         "submit": "Search",
         "language": "en",
     }
     try:
-        resp = _session_get(DATA_URL, params=data)
-        response = validate_response(resp)
+        response = _captcha_request(data)
         if response["success"]:
             html_fragment = _extract_html_fragment(response)
             if not html_fragment:
                 return []
 
-            soup = BeautifulSoup(html_fragment, "html.parser")
+            soup = _soup(html_fragment)
             return table_to_list(soup)
 
     except requests.exceptions.RequestException as e:
@@ -526,35 +814,31 @@ def sci_search_by_aor_code(party_type, aor_code, year, case_status):
         raise
 
 
+@_cached_search
 @retry(
     retry=retry_if_exception_type(requests.exceptions.RequestException),
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=2, max=10),
 )
 def sci_search_by_party_name(party_type, party_name, year, party_status):
-    token_name, token_value, captcha_id, question, answer = init_captcha()
     data = {
         "party_type": party_type,
         "party_name": party_name,
         "year": year,
         "party_status": party_status,
-        "scid": captcha_id,
-        "tok_" + token_name: token_value,
-        "siwp_captcha_value": answer,
         "es_ajax_request": "1",
         "submit": "Search",
         "action": "get_case_status_party_name",
         "language": "en",
     }
     try:
-        resp = _session_get(DATA_URL, params=data)
-        response = validate_response(resp)
+        response = _captcha_request(data)
         if response["success"]:
             html_fragment = _extract_html_fragment(response)
             if not html_fragment:
                 return []
 
-            soup = BeautifulSoup(html_fragment, "html.parser")
+            soup = _soup(html_fragment)
             return table_to_list(soup)
 
     except requests.exceptions.RequestException as e:
@@ -562,6 +846,45 @@ def sci_search_by_party_name(party_type, party_name, year, party_status):
         raise
 
 
+def _batch_search(search_fn, queries: List[tuple], max_workers: int) -> List[Optional[List[dict]]]:
+    """Run `search_fn(*query)` for every query on a thread pool, preserving order."""
+
+    def _run(query: tuple) -> Optional[List[dict]]:
+        try:
+            return search_fn(*query)
+        except Exception as exc:
+            logger.error("SCI batch search %s%r failed: %s", search_fn.__name__, query, exc)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_run, queries))
+
+
+def sci_batch_search_by_party_name(
+    queries: List[tuple], max_workers: int = 8
+) -> List[Optional[List[dict]]]:
+    """
+    Run many party-name searches concurrently.
+
+    Each query is a `(party_type, party_name, year, party_status)` tuple; the
+    result at the same index is that search's rows, or None if it failed.
+    """
+    return _batch_search(sci_search_by_party_name, queries, max_workers)
+
+
+def sci_batch_search_by_aor_code(
+    queries: List[tuple], max_workers: int = 8
+) -> List[Optional[List[dict]]]:
+    """
+    Run many AOR-code searches concurrently.
+
+    Each query is a `(party_type, aor_code, year, case_status)` tuple; the
+    result at the same index is that search's rows, or None if it failed.
+    """
+    return _batch_search(sci_search_by_aor_code, queries, max_workers)
+
+
+@_cached_search
 @retry(
     retry=retry_if_exception_type(requests.exceptions.RequestException),
     stop=stop_after_attempt(5),
@@ -570,7 +893,6 @@ def sci_search_by_party_name(party_type, party_name, year, party_status):
 def sci_search_by_court(
     court, state, bench, case_type, case_number, case_year, order_date
 ):
-    token_name, token_value, captcha_id, question, answer = init_captcha()
     data = {
         "action": "get_case_status_court",
         "case_status_court": court,
@@ -580,22 +902,18 @@ def sci_search_by_court(
         "case_no": case_number,
         "year": case_year,
         "listing_date": order_date,
-        "scid": captcha_id,
-        "siwp_captcha_value": answer,
-        "tok_" + token_name: token_value,
         "es_ajax_request": "1",
         "submit": "Search",
         "language": "en",
     }
     try:
-        resp = _session_get(DATA_URL, params=data)
-        response = validate_response(resp)
+        response = _captcha_request(data)
         if response["success"]:
             html_fragment = _extract_html_fragment(response)
             if not html_fragment:
                 return []
 
-            soup = BeautifulSoup(html_fragment, "html.parser")
+            soup = _soup(html_fragment)
 
             return table_to_list(soup)
 
@@ -604,25 +922,74 @@ def sci_search_by_court(
         raise
 
 
+# Details for a diary number rarely change within a day; keep recent results
+# so retries and repeated lookups skip the three tab fetches entirely.
+DETAILS_CACHE_TTL_SECONDS = 3600
+DETAILS_CACHE_MAX_ENTRIES = 10_000
+_details_cache: "OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]]" = OrderedDict()
+_details_cache_lock = threading.Lock()
+
+
+def _get_cached_details(key: tuple[str, str]) -> Optional[dict[str, Any]]:
+    with _details_cache_lock:
+        entry = _details_cache.get(key)
+        if not entry:
+            return None
+        expires_at, details = entry
+        if expires_at <= time.monotonic():
+            del _details_cache[key]
+            return None
+        _details_cache.move_to_end(key)
+    # Hand out a copy so callers cannot mutate the cached record.
+    return copy.deepcopy(details)
+
+
+def _cache_details(key: tuple[str, str], details: dict[str, Any]) -> None:
+    with _details_cache_lock:
+        _details_cache[key] = (
+            time.monotonic() + DETAILS_CACHE_TTL_SECONDS,
+            copy.deepcopy(details),
+        )
+        _details_cache.move_to_end(key)
+        while len(_details_cache) > DETAILS_CACHE_MAX_ENTRIES:
+            _details_cache.popitem(last=False)
+
+
 @retry(
     retry=retry_if_exception_type(requests.exceptions.RequestException),
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=2, max=10),
 )
 def sci_get_details(diary_no, diary_year):
+    cache_key = (str(diary_no), str(diary_year))
+    cached = _get_cached_details(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        case_html, case_payload = _fetch_case_tab(diary_no, diary_year, "case_details")
+        # The three tabs are independent, so fetch them concurrently.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            case_future = pool.submit(
+                _fetch_case_tab_soup, diary_no, diary_year, "case_details"
+            )
+            listing_future = pool.submit(
+                _fetch_case_tab_soup, diary_no, diary_year, "listing_dates"
+            )
+            judgement_future = pool.submit(
+                _fetch_case_tab_soup, diary_no, diary_year, "judgement_orders"
+            )
+            soup, case_payload = case_future.result()
 
-        if not case_html:
+        if soup is None:
             return None
 
-        soup = BeautifulSoup(case_html, "html.parser")
         registration_no = (
             soup.find("h3").text.split("-")[1].strip() if soup.find("h3") else None
         )
         case_title = soup.find("h4").text.strip() if soup.find("h4") else None
+        cells = _build_label_map(soup)
 
-        diary_info = _extract_td_text(soup, "Diary Number")
+        diary_info = _extract_td_text(cells, "Diary Number")
         diary_number = diary_info.split("Filed on", 1)[0].strip() if diary_info else None
         filing_date = None
         if diary_info:
@@ -630,7 +997,7 @@ def sci_get_details(diary_no, diary_year):
             if len(filing_parts) > 1:
                 filing_date = filing_parts[1].split("[", 1)[0].strip()
 
-        case_info = _extract_td_text(soup, "Case Number")
+        case_info = _extract_td_text(cells, "Case Number")
         case_number = (
             case_info.split("Registered", 1)[0].strip() if case_info else None
         )
@@ -646,35 +1013,35 @@ def sci_get_details(diary_no, diary_year):
             verified_parts = case_info.split("Verified On", 1)
             verified_on = verified_parts[1].split("[", 1)[0].strip(" :")
 
-        listed_info = _extract_td_text(soup, "Present/Last Listed On")
+        listed_info = _extract_td_text(cells, "Present/Last Listed On")
         # print('listed_info:', listed_info)
         listed_on = listed_info.split("[", 1)[0].strip() if listed_info else None
-        status_info = _extract_td_text(soup, "Status/Stage")
+        status_info = _extract_td_text(cells, "Status/Stage")
 
         status = (
             status_info.split("List On", 1)[0].strip() if status_info else None
         )
         pending_or_disposed = 'pending' if 'pending' in status.lower() else 'disposed'
-        category = _extract_td_text(soup, "Category")
+        category = _extract_td_text(cells, "Category")
         acts = [category]
 
-        petitioners_raw = _extract_td_text(soup, "Petitioner(s)", separator="\n")
+        petitioners_raw = _extract_td_text(cells, "Petitioner(s)", separator="\n")
         petitioners = (
             [p.strip() for p in petitioners_raw.splitlines() if p.strip()]
             if petitioners_raw
             else None
         )
-        respondents_raw = _extract_td_text(soup, "Respondent(s)", separator="\n")
+        respondents_raw = _extract_td_text(cells, "Respondent(s)", separator="\n")
         respondents = (
             [r.strip() for r in respondents_raw.splitlines() if r.strip()]
             if respondents_raw
             else None
         )
         petitioner_advocates_raw = _extract_td_text(
-            soup, "Petitioner Advocate(s)", separator="\n"
+            cells, "Petitioner Advocate(s)", separator="\n"
         )
         respondent_advocates_raw = _extract_td_text(
-            soup, "Respondent Advocate(s)", separator="\n"
+            cells, "Respondent Advocate(s)", separator="\n"
         )
         advocates_lines: list[str] = []
         if petitioner_advocates_raw and petitioner_advocates_raw.strip():
@@ -683,36 +1050,34 @@ def sci_get_details(diary_no, diary_year):
             advocates_lines.append(f"Respondent:\n{respondent_advocates_raw.strip()}")
         advocates_raw = "\n\n".join(advocates_lines).strip() or None
 
-        cin_no = _extract_td_text(soup, "CNR Number")
+        cin_no = _extract_td_text(cells, "CNR Number")
 
         judges = None
         if listed_info and "[" in listed_info and "]" in listed_info:
             judges_text = listed_info.split("[", 1)[1].split("]", 1)[0]
             judges = [j.strip() for j in judges_text.split("and") if j.strip()]
 
-        listing_html = None
+        listing_soup = None
         listing_payload: Optional[dict[str, Any]] = None
         try:
-            listing_html, listing_payload = _fetch_case_tab(
-                diary_no, diary_year, "listing_dates"
-            )
+            listing_soup, listing_payload = listing_future.result()
         except (requests.exceptions.RequestException, ValueError) as exc:
             logger.warning("Failed to fetch SCI listing dates: %s", exc)
 
-        listings = _parse_listing_dates(listing_html) if listing_html else []
+        listings = _parse_listing_dates(listing_soup) if listing_soup is not None else []
 
-        judgement_html = None
+        judgement_soup = None
         judgement_payload: Optional[dict[str, Any]] = None
         try:
-            judgement_html, judgement_payload = _fetch_case_tab(
-                diary_no, diary_year, "judgement_orders"
-            )
+            judgement_soup, judgement_payload = judgement_future.result()
         except (requests.exceptions.RequestException, ValueError) as exc:
             logger.warning("Failed to fetch SCI judgement/orders: %s", exc)
 
-        orders = _parse_judgement_orders(judgement_html) if judgement_html else []
+        orders = (
+            _parse_judgement_orders(judgement_soup) if judgement_soup is not None else []
+        )
 
-        return {
+        details = {
             "cin_no": cin_no,
             "registration_no": registration_no,
             "filling_no": diary_number,
@@ -744,6 +1109,8 @@ def sci_get_details(diary_no, diary_year):
                 "judgement_orders": judgement_payload,
             },
         }
+        _cache_details(cache_key, details)
+        return details
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Request failed: {e}")
@@ -756,7 +1123,8 @@ def parse_cause_list_table(soup):
     if not table:
         return []
 
-    headers = [th.text.strip() for th in table.find_all("th")]
+    headers = [th.get_text().strip() for th in table.find_all("th")]
+    url_headers = [f"{header}_url" for header in headers]
     rows = table.find_all("tr")[1:]
 
     current_section = None
@@ -769,21 +1137,27 @@ def parse_cause_list_table(soup):
         # Handle header rows (often used for categories like [FRESH (FOR ADMISSION)])
         # These usually have only one cell with colspan or just a large text
         if len(cells) == 1:
-            current_section = cells[0].text.strip()
+            current_section = cells[0].get_text().strip()
             continue
 
         row_data = {}
         if current_section:
             row_data['section'] = current_section
             
-        for i, cell in enumerate(cells):
-            header = headers[i] if i < len(headers) else f"column_{i+1}"
-            text = cell.text.strip()
-            row_data[header] = text
+        # Column keys are built once per table; rows wider than the header
+        # get positional names, added the first time such a row shows up.
+        if len(cells) > len(headers):
+            extra = [f"column_{i+1}" for i in range(len(headers), len(cells))]
+            headers.extend(extra)
+            url_headers.extend(f"{header}_url" for header in extra)
+
+        links = _row_links(row)
+        for header, url_header, cell in zip(headers, url_headers, cells):
+            row_data[header] = cell.get_text().strip()
 
-            link = cell.find("a")
-            if link and link.get("href"):
-                row_data[f"{header}_url"] = link.get("href")
+            href = links.get(id(cell))
+            if href:
+                row_data[url_header] = href
 
         results.append(row_data)
     return results
@@ -813,7 +1187,6 @@ def sci_get_cause_list(
         msb (str): 'main', 'suppli', 'both'. Defaults to 'both'.
         **kwargs: Additional parameters like 'party_name', 'aor_code', 'court', 'judge'.
     """
-    token_name, token_value, captcha_id, question, answer = init_captcha()
     data = {
         "action": "get_causes",
         "list_type": list_type,
@@ -821,17 +1194,13 @@ def sci_get_cause_list(
         "listing_date": listing_date,
         "causelist_type": causelist_type,
         "msb": msb,
-        "scid": captcha_id,
-        "siwp_captcha_value": answer,
-        "tok_" + token_name: token_value,
         "es_ajax_request": "1",
         "submit": "Search",
     }
     data.update(kwargs)
     
     try:
-        resp = _session_get(DATA_URL, params=data)
-        response = validate_response(resp)
+        response = _captcha_request(data)
         
         if response.get("success"):
             # Check for resultsHtml first as per cause list response structure
@@ -844,7 +1213,7 @@ def sci_get_cause_list(
             if not html_fragment:
                 return []
             
-            soup = BeautifulSoup(html_fragment, "html.parser")
+            soup = _soup(html_fragment)
             
             if "No records found" in soup.text:
                 return []
@@ -863,10 +1232,54 @@ def sci_get_cause_list(
         raise
 
 
-def sci_get_all_cases_for_day(listing_date: str) -> List[Dict[str, Any]]:
+PDF_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+PDF_DOWNLOAD_WORKERS = 8
+
+
+def _download_and_parse_cause_list_pdf(pdf_url: str) -> List[Dict[str, Any]]:
+    """
+    Download one cause-list PDF to a temp file and return its parsed entries,
+    or an empty list if the download or parse fails.
+    """
+    logger.info(f"Downloading PDF from {pdf_url}...")
+    try:
+        # Stream straight to disk rather than holding the whole PDF in
+        # resp.content; the first chunk doubles as the signature check.
+        with _session_get(pdf_url, stream=True) as resp:
+            resp.raise_for_status()
+            chunks = resp.iter_content(chunk_size=PDF_DOWNLOAD_CHUNK_SIZE)
+            head = next(chunks, b"")
+            if not head.startswith(b"%PDF-"):
+                logger.warning(f"Skipping {pdf_url}: response is not a PDF")
+                return []
+
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
+                tmp_pdf.write(head)
+                for chunk in chunks:
+                    tmp_pdf.write(chunk)
+                tmp_pdf_path = tmp_pdf.name
+
+        try:
+            # Parse PDF
+            entries = sci_parse_cause_list_pdf(tmp_pdf_path)
+            logger.info(f"Parsed {len(entries)} entries from PDF.")
+            return entries
+        finally:
+            if os.path.exists(tmp_pdf_path):
+                os.remove(tmp_pdf_path)
+
+    except Exception as e:
+        logger.error(f"Failed to process PDF {pdf_url}: {e}")
+        return []
+
+
+def sci_get_all_cases_for_day(
+    listing_date: str, max_workers: int = PDF_DOWNLOAD_WORKERS
+) -> List[Dict[str, Any]]:
     """
     Fetch all cases listed for a specific day by fetching the 'All Courts' cause list PDFs
-    and parsing them.
+    and parsing them. PDFs are downloaded concurrently; entries keep the order of
+    the cause-list rows.
     """
     logger.info(f"Fetching 'All Courts' cause list for {listing_date}...")
     
@@ -878,7 +1291,7 @@ def sci_get_all_cases_for_day(listing_date: str) -> List[Dict[str, Any]]:
         logger.warning(f"No cause lists found for {listing_date}")
         return []
         
-    all_cases = []
+    pdf_urls = []
     
     for row in pdf_rows:
         pdf_url = None
@@ -896,53 +1309,55 @@ def sci_get_all_cases_for_day(listing_date: str) -> List[Dict[str, Any]]:
              else:
                  pass 
 
-        logger.info(f"Downloading PDF from {pdf_url}...")
-        try:
-            resp = _session_get(pdf_url)
-            resp.raise_for_status()
-            
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_pdf:
-                tmp_pdf.write(resp.content)
-                tmp_pdf_path = tmp_pdf.name
-                
-            try:
-                # Parse PDF
-                entries = sci_parse_cause_list_pdf(tmp_pdf_path)
-                logger.info(f"Parsed {len(entries)} entries from PDF.")
-                all_cases.extend(entries)
-            finally:
-                if os.path.exists(tmp_pdf_path):
-                    os.remove(tmp_pdf_path)
-                    
-        except Exception as e:
-            logger.error(f"Failed to process PDF {pdf_url}: {e}")
-            continue
+        pdf_urls.append(pdf_url)
+
+    if not pdf_urls:
+        return []
+
+    all_cases = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pdf_urls)))) as pool:
+        for entries in pool.map(_download_and_parse_cause_list_pdf, pdf_urls):
+            all_cases.extend(entries)
             
     return all_cases
 
 
+_VS_RE = re.compile(r"\b(Versus|VS\.?|V/S)\b", re.IGNORECASE)
+# Deletes what r"[\s\-]+" matched: "-" and every Unicode whitespace
+# character (all of which sit below U+3001).
+_PDF_NORM_TRANS = dict.fromkeys(
+    [ord("-")] + [cp for cp in range(0x3001) if chr(cp).isspace()]
+)
+
+
+def _is_item_no(text: str) -> bool:
+    """True for item numbers such as "12" or "12.1", without a regex match."""
+    whole, dot, frac = text.partition(".")
+    return whole.isdecimal() and (not dot or frac.isdecimal())
+
+
+# Page header and table-heading text repeated on every cause-list page.
+_PDF_SKIP_MARKERS = (
+    "SUPREME COURT OF INDIA",
+    "LIST OF MATTERS",
+    "SNo. Case No.",
+    "Petitioner / Respondent",
+)
+
+
 def _clean_pdf_line(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
+    # split/join collapses whitespace runs and trims the ends in one C pass.
+    cleaned = " ".join((text or "").split())
     if not cleaned:
         return ""
     if cleaned.startswith("Page ") and " of " in cleaned:
         return ""
-    if "SUPREME COURT OF INDIA" in cleaned:
-        return ""
-    if "LIST OF MATTERS" in cleaned:
-        return ""
-    if "SNo. Case No." in cleaned:
-        return ""
-    if "Petitioner / Respondent" in cleaned:
-        return ""
+    for marker in _PDF_SKIP_MARKERS:
+        if marker in cleaned:
+            return ""
     return cleaned
 
 
-def _is_vs_line(text: str) -> bool:
-    normalized = re.sub(r"\s+", "", (text or "").upper())
-    return normalized in {"VERSUS", "VS", "V/S", "VS.", "V.S."}
-
-
 def _parse_single_sci_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     case_lines = entry.get("case_lines") or []
     party_lines = entry.get("party_lines") or []
@@ -951,16 +1366,16 @@ def _parse_single_sci_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
 
     # Extract Case Number
     # Pattern e.g., "C.A. No. 9337/2022", "SLP(C) No. 18263/2022"
-    case_no_text = " ".join(case_lines).strip()
-    # Basic cleanup
-    case_no_text = re.sub(r"\s+", " ", case_no_text)
+    # Lines come from _clean_pdf_line already whitespace-collapsed and
+    # stripped, so joining them needs no further cleanup.
+    case_no_text = " ".join(case_lines)
     
     petitioner: Optional[str] = None
     respondent: Optional[str] = None
     
     # Split parties by "Versus"
     party_text = "\n".join(party_lines)
-    vs_match = re.search(r"\b(Versus|VS\.?|V/S)\b", party_text, re.IGNORECASE)
+    vs_match = _VS_RE.search(party_text)
     
     if vs_match:
         petitioner = party_text[:vs_match.start()].strip().replace("\n", " ")
@@ -988,6 +1403,67 @@ def _parse_single_sci_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+class _PdfLine(NamedTuple):
+    """A cleaned PDF text line and the top-left corner of its bbox."""
+
+    x: float
+    y: float
+    text: str
+
+
+def _extract_lines_from_pdf_page(page: "fitz.Page") -> List[_PdfLine]:
+    """
+    Return the page's cleaned text lines with their top-left coordinates,
+    sorted top to bottom, left to right.
+    """
+    clean = _clean_pdf_line
+    lines: List[_PdfLine] = []
+
+    # Per-line bboxes are needed for column/row assignment. "words" yields
+    # flat tuples tagged with their block and line numbers, which is much
+    # cheaper than building the nested span dicts of "dict" output; joining
+    # a line's words with single spaces is what _clean_pdf_line produced
+    # from the spans anyway.
+    grouped: Dict[tuple, list] = {}
+    for x0, y0, _, _, word, block_no, line_no, _ in page.get_text(
+        "words", flags=fitz.TEXTFLAGS_TEXT
+    ):
+        entry = grouped.get((block_no, line_no))
+        if entry is None:
+            grouped[(block_no, line_no)] = [x0, y0, [word]]
+            continue
+        if x0 < entry[0]:
+            entry[0] = x0
+        if y0 < entry[1]:
+            entry[1] = y0
+        entry[2].append(word)
+
+    for x0, y0, words in grouped.values():
+        cleaned = clean(" ".join(words))
+        if cleaned:
+            lines.append(_PdfLine(float(x0), float(y0), cleaned))
+
+    lines.sort(key=operator.attrgetter("y", "x"))
+    return lines
+
+
+# Column boundaries of the SCI cause-list layout: item no, case no,
+# parties, advocates. bisect_right over the edges gives a line's column.
+_COLUMN_EDGES = (65, 180, 420)
+_COLUMN_KEYS = (None, "case_lines", "party_lines", "advocate_lines")
+
+
+def _add_lines_to_entry(entry: Dict[str, Any], lines) -> None:
+    """Append lines to an entry's raw lines and to the column each falls in."""
+    raw_lines = entry["raw_lines"]
+    columns = [entry[key] if key else None for key in _COLUMN_KEYS]
+    for line in lines:
+        raw_lines.append(line.text)
+        column = columns[bisect.bisect_right(_COLUMN_EDGES, line.x)]
+        if column is not None:
+            column.append(line.text)
+
+
 def sci_parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
     """
     Parse SCI cause-list PDF and extract structured entries.
@@ -997,107 +1473,58 @@ def sci_parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
     with fitz.open(pdf_path) as doc:
         open_entry: Optional[Dict[str, Any]] = None
 
-        for page_idx in range(doc.page_count):
-            page = doc[page_idx]
-            lines: List[Dict[str, Any]] = []
-
-            for block in page.get_text("dict").get("blocks", []):
-                if block.get("type") != 0:
-                    continue
-                for line in block.get("lines", []):
-                    x0, y0, _, _ = line.get("bbox", (0.0, 0.0, 0.0, 0.0))
-                    # Skip header/footer zones if needed (approximate)
-                    if y0 < 50 or y0 > 800: 
-                        pass # Adjust as needed based on analysis
-                    
-                    line_text = "".join(span.get("text", "") for span in line.get("spans", []))
-                    cleaned = _clean_pdf_line(line_text)
-                    if not cleaned:
-                        continue
-                    lines.append({"x": float(x0), "y": float(y0), "text": cleaned})
-
-            lines.sort(key=lambda item: (item["y"], item["x"]))
+        for page_idx, page in enumerate(doc):
+            lines = _extract_lines_from_pdf_page(page)
             
             # Start finding entries based on Item No (x < 65)
             # Item numbers are usually integers, sometimes with decimals like 1.1
             
             starts = [
                 line for line in lines 
-                if line["x"] < 65 and re.match(r"^\d+(\.\d+)?$", line["text"])
+                if line.x < 65 and _is_item_no(line.text)
             ]
-            starts.sort(key=lambda item: item["y"])
 
             if not starts:
                 # Continuation page? Append to open entry
                 if open_entry:
-                    for line in lines:
-                        x = line["x"]
-                        txt = line["text"]
-                        open_entry["raw_lines"].append(txt)
-                        if 65 <= x < 180:
-                            open_entry["case_lines"].append(txt)
-                        elif 180 <= x < 420:
-                            open_entry["party_lines"].append(txt)
-                        elif x >= 420:
-                            open_entry["advocate_lines"].append(txt)
+                    _add_lines_to_entry(open_entry, lines)
                 continue
 
-            first_start_y = starts[0]["y"]
-            
+            # Lines are sorted by y, so the text above the first start and
+            # each entry's vertical band are contiguous slices located by
+            # bisection.
+            line_ys = [line.y for line in lines]
+
             # Close previous page's open entry if content exists before first new entry
             if open_entry:
-                for line in lines:
-                    if line["y"] >= first_start_y:
-                        continue
-                    x = line["x"]
-                    txt = line["text"]
-                    open_entry["raw_lines"].append(txt)
-                    if 65 <= x < 180:
-                        open_entry["case_lines"].append(txt)
-                    elif 180 <= x < 420:
-                        open_entry["party_lines"].append(txt)
-                    elif x >= 420:
-                        open_entry["advocate_lines"].append(txt)
-                
+                _add_lines_to_entry(
+                    open_entry, lines[: bisect.bisect_left(line_ys, starts[0].y)]
+                )
                 entries.append(_parse_single_sci_entry(open_entry))
                 open_entry = None
 
+            # Each band ends where the next one begins, so one bisection per
+            # start yields every cut; the last band runs to the end of page.
+            cuts = [bisect.bisect_left(line_ys, start.y) for start in starts]
+            cuts.append(len(lines))
+            page_no = page_idx + 1
+
             # Process entries on this page
             for idx, start in enumerate(starts):
-                y_start = start["y"]
-                y_end = starts[idx + 1]["y"] if idx + 1 < len(starts) else float("inf")
+                band = lines[cuts[idx] : cuts[idx + 1]]
                 
                 segment = {
-                    "item_no": start["text"],
-                    "page_no": page_idx + 1,
+                    "item_no": start.text,
+                    "page_no": page_no,
                     "raw_lines": [],
                     "case_lines": [],
                     "party_lines": [],
                     "advocate_lines": [],
                 }
-                
-                for line in lines:
-                    # Check if line is within vertical range of this entry
-                    # Note: y_end is start of next entry. 
-                    # We might grab footer text if not careful, but _clean_pdf_line handles some.
-                    if not (y_start <= line["y"] < y_end):
-                        continue
-                    
-                    x = line["x"]
-                    txt = line["text"]
-                    
-                    # Don't add the item number itself to raw lines or specific columns
-                    if line is start:
-                        continue
-
-                    segment["raw_lines"].append(txt)
-                    
-                    if 65 <= x < 180:
-                        segment["case_lines"].append(txt)
-                    elif 180 <= x < 420:
-                        segment["party_lines"].append(txt)
-                    elif x >= 420:
-                        segment["advocate_lines"].append(txt)
+
+                # Note: the band ends at the start of the next entry.
+                # Don't add the item number itself to raw lines or specific columns
+                _add_lines_to_entry(segment, (line for line in band if line is not start))
 
                 if idx + 1 < len(starts):
                     entries.append(_parse_single_sci_entry(segment))
@@ -1111,7 +1538,28 @@ def sci_parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
 
 
 def _pdf_normalize(text: str) -> str:
-    return re.sub(r"[\s\-]+", "", (text or "").upper())
+    return (text or "").translate(_PDF_NORM_TRANS).upper()
+
+
+@lru_cache(maxsize=8)
+def _parse_cause_list_pdf_cached(
+    pdf_path: str, mtime_ns: int, size: int
+) -> tuple[tuple[Dict[str, Any], str, str], ...]:
+    """
+    Memoize the parsed entries of a cause-list PDF so looking up several case
+    numbers in the same file runs MuPDF text extraction only once. The file's
+    mtime and size are part of the key so a rewritten file is parsed again.
+    Each entry is paired with its normalized case_no and text, so lookups
+    compare against prebuilt strings instead of re-normalizing every entry.
+    """
+    return tuple(
+        (
+            entry,
+            _pdf_normalize(entry.get("case_no", "")),
+            _pdf_normalize(entry.get("text", "")),
+        )
+        for entry in sci_parse_cause_list_pdf(pdf_path)
+    )
 
 
 def sci_find_case_entries_in_pdf(pdf_path: str, case_number: str) -> List[Dict[str, Any]]:
@@ -1119,26 +1567,23 @@ def sci_find_case_entries_in_pdf(pdf_path: str, case_number: str) -> List[Dict[s
     Find cause-list entries that match a case number.
     Replaces old logic with robust full-PDF parsing.
     """
-    all_entries = sci_parse_cause_list_pdf(pdf_path)
+    stat = os.stat(pdf_path)
+    all_entries = _parse_cause_list_pdf_cached(pdf_path, stat.st_mtime_ns, stat.st_size)
     target = _pdf_normalize(case_number)
-    
-    matches = []
-    for entry in all_entries:
-        # Check in case_no field
-        if target in _pdf_normalize(entry.get("case_no", "")):
-            matches.append(entry)
-        # Fallback: check in full text
-        elif target in _pdf_normalize(entry.get("text", "")):
-            matches.append(entry)
-            
-    return matches
+
+    # Check in case_no field, falling back to the full entry text
+    return [
+        dict(entry)
+        for entry, norm_case_no, norm_text in all_entries
+        if target in norm_case_no or target in norm_text
+    ]
 
 
 def _fetch_order_document(url: str, referer: Optional[str] = None) -> requests.Response:
     headers = {}
     if referer:
         headers["Referer"] = referer
-    return _session_get(url, headers=headers)
+    return _session_get(url, headers=headers, timeout=30)
 
 
 async def persist_orders_to_storage(
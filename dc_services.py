@@ -1,12 +1,13 @@
 import html
 import json
 import logging
+import operator
 import os
 import re
 import time
 from datetime import datetime
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 from urllib.parse import urljoin
 
 import ddddocr
@@ -31,10 +32,12 @@ _ocr = ddddocr.DdddOcr(show_ad=False)
 DC_CASE_NO_PATTERN = re.compile(
     r"\b(?:[A-Z0-9.()-]{1,20}/)?[A-Z0-9.()-]{1,20}/\d{1,8}/\d{2,4}\b"
 )
+_WS_RE = re.compile(r"\s+")
+_ENTRY_START_RE = re.compile(r"^(\d{1,4})\s*[.)-]?\s+")
 
 
 def _normalize_case_token(case_no: str) -> str:
-    return re.sub(r"\s+", "", (case_no or "").upper())
+    return _WS_RE.sub("", (case_no or "").upper())
 
 
 def _case_tail(case_no: str) -> str:
@@ -45,8 +48,16 @@ def _case_tail(case_no: str) -> str:
     return token
 
 
+class _PdfLine(NamedTuple):
+    """A cleaned PDF text line and the top-left corner of its bbox."""
+
+    x: float
+    y: float
+    text: str
+
+
 def _clean_pdf_line(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
+    cleaned = " ".join((text or "").split())
     if not cleaned:
         return ""
     if cleaned.startswith("Page ") and " of " in cleaned:
@@ -63,7 +74,7 @@ def _normalize_order_date(date_str: Optional[str]) -> Optional[str]:
 
     # eCourts sometimes uses ordinal day formats like "19th February 2026".
     # Supabase date columns expect ISO `YYYY-MM-DD`, so normalize aggressively.
-    value = re.sub(r"\s+", " ", value)
+    value = _WS_RE.sub(" ", value)
     value = re.sub(r"\b(\d{1,2})(st|nd|rd|th)\b", r"\1", value, flags=re.I)
 
     formats = [
@@ -117,27 +128,27 @@ def parse_dc_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
     with fitz.open(pdf_path) as doc:
         for page_idx in range(doc.page_count):
             page = doc[page_idx]
-            lines: List[Dict[str, Any]] = []
+            lines: List[_PdfLine] = []
 
-            for block in page.get_text("dict").get("blocks", []):
+            for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT).get("blocks", []):
                 if block.get("type") != 0:
                     continue
                 for line in block.get("lines", []):
                     x0, y0, _, _ = line.get("bbox", (0.0, 0.0, 0.0, 0.0))
-                    line_text = "".join(span.get("text", "") for span in line.get("spans", []))
+                    line_text = "".join([span.get("text", "") for span in line.get("spans", [])])
                     cleaned = _clean_pdf_line(line_text)
                     if not cleaned:
                         continue
-                    lines.append({"x": float(x0), "y": float(y0), "text": cleaned})
+                    lines.append(_PdfLine(float(x0), float(y0), cleaned))
 
-            lines.sort(key=lambda item: (item["y"], item["x"]))
+            lines.sort(key=operator.attrgetter("y", "x"))
             if not lines:
                 continue
 
             open_entry: Optional[Dict[str, Any]] = None
             for line in lines:
-                txt = line["text"]
-                start_match = re.match(r"^(\d{1,4})\s*[.)-]?\s+", txt)
+                txt = line.text
+                start_match = _ENTRY_START_RE.match(txt)
 
                 if start_match:
                     if open_entry:
@@ -167,7 +178,7 @@ def parse_dc_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
         case_nos: List[str] = []
         seen = set()
         for line in raw_lines:
-            normalized_line = re.sub(r"\s+", "", line.upper())
+            normalized_line = _WS_RE.sub("", line.upper())
             for token in DC_CASE_NO_PATTERN.findall(normalized_line):
                 normalized = _normalize_case_token(token)
                 if normalized and normalized not in seen:
@@ -695,30 +706,63 @@ class EcourtsWebScraper:
             'orders': []
         }
         
-        # Helper to find value in tables
-        def get_table_value(table, label_text):
-            if not table: return None
-            label = table.find('label', string=re.compile(label_text, re.I)) or \
-                    table.find(string=re.compile(label_text, re.I))
-            if label:
-                # Value is usually in the next td or same td
-                # Try finding parent td then next sibling td
-                td = label.find_parent('td')
-                if td:
-                    next_td = td.find_next_sibling('td')
-                    if next_td:
-                        return next_td.get_text(strip=True)
-            return None
+        # Helper to find values in tables
+        def get_table_values(table, label_texts):
+            """
+            Resolve several labels with two passes over the table (its <label>
+            tags, then its strings) instead of two searches per label. Each
+            label still resolves to the first <label> whose text matches, else
+            the first matching string.
+            """
+            patterns = {text: re.compile(text, re.I) for text in label_texts}
+            found = {}
+            for label in table.find_all('label'):
+                text = label.string
+                if text is None:
+                    continue
+                for label_text, pattern in patterns.items():
+                    if label_text not in found and pattern.search(text):
+                        found[label_text] = label
+            if len(found) < len(patterns):
+                for text in table.find_all(string=True):
+                    for label_text, pattern in patterns.items():
+                        if label_text not in found and pattern.search(text):
+                            found[label_text] = text
+
+            values = {}
+            for label_text in label_texts:
+                value = None
+                label = found.get(label_text)
+                if label:
+                    # Value is usually in the next td or same td
+                    # Try finding parent td then next sibling td
+                    td = label.find_parent('td')
+                    if td:
+                        next_td = td.find_next_sibling('td')
+                        if next_td:
+                            value = next_td.get_text(strip=True)
+                values[label_text] = value
+            return values
 
         # Case Details Table
         cd_table = soup.find('table', class_='case_details_table')
         if cd_table:
-            details['case_type'] = get_table_value(cd_table, 'Case Type')
-            details['filing_no'] = get_table_value(cd_table, 'Filing Number')
-            filing_date = get_table_value(cd_table, 'Filing Date')
+            cd_values = get_table_values(
+                cd_table,
+                (
+                    'Case Type',
+                    'Filing Number',
+                    'Filing Date',
+                    'Registration Number',
+                    'Registration Date',
+                ),
+            )
+            details['case_type'] = cd_values['Case Type']
+            details['filing_no'] = cd_values['Filing Number']
+            filing_date = cd_values['Filing Date']
             details['filing_date'] = _normalize_order_date(filing_date) or filing_date
-            details['registration_no'] = get_table_value(cd_table, 'Registration Number')
-            registration_date = get_table_value(cd_table, 'Registration Date')
+            details['registration_no'] = cd_values['Registration Number']
+            registration_date = cd_values['Registration Date']
             details['registration_date'] = _normalize_order_date(registration_date) or registration_date
             
             # CNR Number is special
@@ -729,20 +773,33 @@ class EcourtsWebScraper:
         # Case Status Table
         cs_table = soup.find('table', class_='case_status_table')
         if cs_table:
-            first_hearing_date = get_table_value(cs_table, 'First Hearing Date')
+            cs_values = get_table_values(
+                cs_table,
+                (
+                    'First Hearing Date',
+                    'Next Hearing Date',
+                    'Next Hearing',
+                    'Next Date',
+                    'Decision Date',
+                    'Case Status',
+                    'Nature of Disposal',
+                    'Court Number and Judge',
+                ),
+            )
+            first_hearing_date = cs_values['First Hearing Date']
             details['first_hearing_date'] = _normalize_order_date(first_hearing_date) or first_hearing_date
             next_hearing = (
-                get_table_value(cs_table, 'Next Hearing Date')
-                or get_table_value(cs_table, 'Next Hearing')
-                or get_table_value(cs_table, 'Next Date')
+                cs_values['Next Hearing Date']
+                or cs_values['Next Hearing']
+                or cs_values['Next Date']
             )
             normalized_next = _normalize_order_date(next_hearing) or next_hearing
             details['next_listing_date'] = normalized_next
-            decision_date = get_table_value(cs_table, 'Decision Date')
+            decision_date = cs_values['Decision Date']
             details['decision_date'] = _normalize_order_date(decision_date) or decision_date
-            details['status'] = get_table_value(cs_table, 'Case Status')
-            details['nature_of_disposal'] = get_table_value(cs_table, 'Nature of Disposal')
-            details['court_no_judge'] = get_table_value(cs_table, 'Court Number and Judge')
+            details['status'] = cs_values['Case Status']
+            details['nature_of_disposal'] = cs_values['Nature of Disposal']
+            details['court_no_judge'] = cs_values['Court Number and Judge']
 
         # Petitioner and Respondent
         pet_table = soup.find('table', class_='Petitioner_Advocate_table')
@@ -1,14 +1,18 @@
+import bisect
 import logging
+import operator
 import os
 import re
+import shutil
 from datetime import datetime, timedelta
 from hashlib import sha256
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 from urllib.parse import urljoin
 
 import fitz
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
                       wait_exponential)
@@ -33,9 +37,20 @@ CAUSE_LIST_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
 }
 
+# Index pages and PDFs of one listing date are fetched back to back from the
+# same host; a shared session keeps those connections alive between requests.
+cause_list_session = requests.Session()
+cause_list_session.headers.update(CAUSE_LIST_HEADERS)
+_cause_list_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0)
+cause_list_session.mount("https://", _cause_list_adapter)
+cause_list_session.mount("http://", _cause_list_adapter)
+
+PDF_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 DELHI_CASE_NO_PATTERN = re.compile(
     r"\b[A-Z][A-Z0-9()./&-]{0,40}\s*\d{1,7}/\d{4}\b"
 )
+_WS_RE = re.compile(r"\s+")
 
 
 def parse_listing_date(date_str: Optional[str]) -> datetime:
@@ -50,7 +65,7 @@ def parse_listing_date(date_str: Optional[str]) -> datetime:
 
 
 def _normalize_case_token(case_no: str) -> str:
-    token = re.sub(r"\s+", " ", (case_no or "").upper()).strip()
+    token = _WS_RE.sub(" ", (case_no or "").upper()).strip()
     token = token.replace(" /", "/").replace("/ ", "/")
     return token
 
@@ -67,8 +82,21 @@ def _case_tail(case_no: str) -> str:
     return compact
 
 
+class _PdfLine(NamedTuple):
+    """A cleaned PDF text line and the top-left corner of its bbox."""
+
+    x: float
+    y: float
+    text: str
+
+
+def _is_serial_no(text: str) -> bool:
+    """True for a 1-4 digit serial number, without a regex match."""
+    return len(text) <= 4 and text.isdecimal()
+
+
 def _clean_pdf_line(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
+    cleaned = " ".join((text or "").split())
     if not cleaned:
         return ""
     if cleaned.startswith("Page ") and " of " in cleaned:
@@ -119,54 +147,53 @@ def parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
 
         for page_idx in range(doc.page_count):
             page = doc[page_idx]
-            lines: List[Dict[str, Any]] = []
+            lines: List[_PdfLine] = []
 
-            for block in page.get_text("dict").get("blocks", []):
+            for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT).get("blocks", []):
                 if block.get("type") != 0:
                     continue
                 for line in block.get("lines", []):
                     x0, y0, _, _ = line.get("bbox", (0.0, 0.0, 0.0, 0.0))
                     if y0 < 100 or y0 > 780:
                         continue
-                    line_text = "".join(span.get("text", "") for span in line.get("spans", []))
+                    line_text = "".join([span.get("text", "") for span in line.get("spans", [])])
                     cleaned = _clean_pdf_line(line_text)
                     if not cleaned:
                         continue
-                    lines.append({"x": float(x0), "y": float(y0), "text": cleaned})
+                    lines.append(_PdfLine(float(x0), float(y0), cleaned))
 
-            lines.sort(key=lambda item: (item["y"], item["x"]))
+            lines.sort(key=operator.attrgetter("y", "x"))
             starts = [
                 line
                 for line in lines
-                if line["x"] < 75 and re.fullmatch(r"\d{1,4}", line["text"])
+                if line.x < 75 and _is_serial_no(line.text)
             ]
-            starts.sort(key=lambda item: item["y"])
 
             if not starts:
                 if open_entry:
-                    open_entry["raw_lines"].extend(line["text"] for line in lines)
+                    open_entry["raw_lines"].extend(line.text for line in lines)
                 continue
 
-            first_start_y = starts[0]["y"]
+            # Lines are sorted by y, so the text above the first start and
+            # each entry's band are contiguous slices found by bisection.
+            line_ys = [line.y for line in lines]
             if open_entry:
-                for line in lines:
-                    if line["y"] >= first_start_y:
-                        continue
-                    open_entry["raw_lines"].append(line["text"])
+                head = lines[: bisect.bisect_left(line_ys, starts[0].y)]
+                open_entry["raw_lines"].extend(line.text for line in head)
                 entries.append(_parse_single_cause_list_entry(open_entry))
                 open_entry = None
 
+            cuts = [bisect.bisect_left(line_ys, start.y) for start in starts]
+            cuts.append(len(lines))
+            page_no = page_idx + 1
+
             for idx, start in enumerate(starts):
-                y_start = start["y"]
-                y_end = starts[idx + 1]["y"] if idx + 1 < len(starts) else float("inf")
+                band = lines[cuts[idx] : cuts[idx + 1]]
                 segment = {
-                    "item_no": start["text"],
-                    "page_no": page_idx + 1,
-                    "raw_lines": [],
+                    "item_no": start.text,
+                    "page_no": page_no,
+                    "raw_lines": [line.text for line in band],
                 }
-                for line in lines:
-                    if y_start <= line["y"] < y_end:
-                        segment["raw_lines"].append(line["text"])
 
                 if idx + 1 < len(starts):
                     entries.append(_parse_single_cause_list_entry(segment))
@@ -184,8 +211,13 @@ def find_case_entries(pdf_path: str, case_no: str) -> List[Dict[str, Any]]:
     Find Delhi HC cause-list entries that match a case number.
     Matching is based on case tail: <number>/<year>.
     """
+    return _match_case_entries(parse_cause_list_pdf(pdf_path), case_no)
+
+
+def _match_case_entries(
+    parsed: List[Dict[str, Any]], case_no: str
+) -> List[Dict[str, Any]]:
     target_tail = _case_tail(case_no)
-    parsed = parse_cause_list_pdf(pdf_path)
     if not target_tail:
         return parsed
 
@@ -260,7 +292,7 @@ def fetch_cause_list_pdfs(
     seen_urls = set()
     for page_url in all_page_urls:
         try:
-            resp = requests.get(page_url, headers=CAUSE_LIST_HEADERS, timeout=30)
+            resp = cause_list_session.get(page_url, timeout=30)
             resp.raise_for_status()
         except Exception as exc:
             logger.warning("Failed to fetch cause-list index page %s: %s", page_url, exc)
@@ -305,11 +337,7 @@ def fetch_cause_list_pdf_bytes(
     if not pdfs:
         raise ValueError(f"No Delhi HC cause-list PDF found for {listing_date.strftime('%d-%m-%Y')}")
 
-    response = requests.get(
-        pdfs[0]["pdf_url"],
-        headers=CAUSE_LIST_HEADERS,
-        timeout=60,
-    )
+    response = cause_list_session.get(pdfs[0]["pdf_url"], timeout=60)
     response.raise_for_status()
     return response.content
 
@@ -339,15 +367,21 @@ def fetch_cause_list_entries(
     for pdf in pdfs:
         tmp_path: Optional[str] = None
         try:
-            resp = requests.get(pdf["pdf_url"], headers=CAUSE_LIST_HEADERS, timeout=60)
-            resp.raise_for_status()
-            with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
-                tmp_pdf.write(resp.content)
-                tmp_path = tmp_pdf.name
-
+            # Stream the PDF to disk instead of buffering it in resp.content.
+            with cause_list_session.get(pdf["pdf_url"], timeout=60, stream=True) as resp:
+                resp.raise_for_status()
+                with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_pdf:
+                    tmp_path = tmp_pdf.name
+                    # Let urllib3 undo any Content-Encoding while copying the
+                    # raw stream straight into the file.
+                    resp.raw.decode_content = True
+                    shutil.copyfileobj(resp.raw, tmp_pdf, PDF_DOWNLOAD_CHUNK_SIZE)
+
+            # Parse each PDF once and match against the parsed entries rather
+            # than reopening it through find_case_entries.
             parsed_entries = parse_cause_list_pdf(tmp_path)
             case_matched_entries = (
-                find_case_entries(tmp_path, case_no) if case_no else parsed_entries
+                _match_case_entries(parsed_entries, case_no) if case_no else parsed_entries
             )
             all_entries.extend(parsed_entries)
             matched_entries.extend(case_matched_entries)
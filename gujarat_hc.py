@@ -1,6 +1,8 @@
+import bisect
 import hashlib
 import json
 import logging
+import operator
 import os
 import re
 import time
@@ -8,7 +10,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 from urllib.parse import parse_qs, urlparse
 
 import ddddocr
@@ -64,10 +66,12 @@ CAUSE_LIST_HOME_URL = "https://gujarathc-casestatus.nic.in/gujarathc/"
 CAUSE_LIST_PRINT_URL = "https://gujarathc-casestatus.nic.in/gujarathc/printBoardNew"
 
 CASE_NO_PATTERN = re.compile(r"\b(?:[A-Z]{1,4}/)?[A-Z]{1,10}/\d{1,7}/\d{4}\b")
+_WS_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
 
 
 def _normalize_case_token(case_no: str) -> str:
-    return re.sub(r"\s+", "", (case_no or "").upper())
+    return _WS_RE.sub("", (case_no or "").upper())
 
 
 def _case_tail(case_no: str) -> str:
@@ -78,13 +82,29 @@ def _case_tail(case_no: str) -> str:
     return token
 
 
+_VS_TOKENS = frozenset({"V/S", "VS", "V.S", "V/S."})
+
+
 def _is_vs_line(text: str) -> bool:
-    normalized = re.sub(r"\s+", "", (text or "").upper())
-    return normalized in {"V/S", "VS", "V.S", "V/S."}
+    # Drop all whitespace with split/join, which is cheaper than a regex sub.
+    return "".join((text or "").split()).upper() in _VS_TOKENS
+
+
+class _PdfLine(NamedTuple):
+    """A cleaned PDF text line and the top-left corner of its bbox."""
+
+    x: float
+    y: float
+    text: str
+
+
+def _is_serial_no(text: str) -> bool:
+    """True for a 1-4 digit serial number, without a regex match."""
+    return len(text) <= 4 and text.isdecimal()
 
 
 def _clean_pdf_line(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", (text or "")).strip()
+    cleaned = " ".join((text or "").split())
     if not cleaned:
         return ""
     if cleaned.startswith("Page ") and " of " in cleaned:
@@ -156,12 +176,12 @@ def _parse_single_cause_list_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
         ]
         respondent_lines: List[str] = []
         petitioner_norm_set = {
-            re.sub(r"[^A-Z0-9]+", "", line.upper()) for line in petitioner_lines if line
+            _NON_ALNUM_RE.sub("", line.upper()) for line in petitioner_lines if line
         }
         for line in party_lines[first_vs + 1:next_vs]:
             if not line or _is_vs_line(line) or _is_party_noise_line(line):
                 continue
-            norm_line = re.sub(r"[^A-Z0-9]+", "", line.upper())
+            norm_line = _NON_ALNUM_RE.sub("", line.upper())
             if norm_line and norm_line in petitioner_norm_set:
                 break
             respondent_lines.append(line)
@@ -227,23 +247,23 @@ def parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
 
         for page_idx in range(doc.page_count):
             page = doc[page_idx]
-            lines: List[Dict[str, Any]] = []
+            lines: List[_PdfLine] = []
 
-            for block in page.get_text("dict").get("blocks", []):
+            for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT).get("blocks", []):
                 if block.get("type") != 0:
                     continue
                 for line in block.get("lines", []):
                     x0, y0, _, _ = line.get("bbox", (0.0, 0.0, 0.0, 0.0))
                     if y0 < 140 or y0 > 770:
                         continue
-                    line_text = "".join(span.get("text", "") for span in line.get("spans", []))
+                    line_text = "".join([span.get("text", "") for span in line.get("spans", [])])
                     cleaned = _clean_pdf_line(line_text)
                     if not cleaned:
                         continue
-                    lines.append({"x": float(x0), "y": float(y0), "text": cleaned})
+                    lines.append(_PdfLine(float(x0), float(y0), cleaned))
 
-            lines.sort(key=lambda item: (item["y"], item["x"]))
-            page_tokens = {line["text"].upper() for line in lines}
+            lines.sort(key=operator.attrgetter("y", "x"))
+            page_tokens = {line.text.upper() for line in lines}
             has_table_header = (
                 "SNO" in page_tokens
                 and "CASE DETAILS" in page_tokens
@@ -254,15 +274,14 @@ def parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
                 continue
 
             starts = [
-                line for line in lines if line["x"] < 70 and re.fullmatch(r"\d{1,4}", line["text"])
+                line for line in lines if line.x < 70 and _is_serial_no(line.text)
             ]
-            starts.sort(key=lambda item: item["y"])
 
             if not starts:
                 if open_entry:
                     for line in lines:
-                        x = line["x"]
-                        txt = line["text"]
+                        x = line.x
+                        txt = line.text
                         open_entry["raw_lines"].append(txt)
                         if 70 <= x < 200:
                             open_entry["case_lines"].append(txt)
@@ -272,13 +291,13 @@ def parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
                             open_entry["advocate_lines"].append(txt)
                 continue
 
-            first_start_y = starts[0]["y"]
+            # Lines are sorted by y, so the text above the first start and
+            # each entry's band are contiguous slices found by bisection.
+            line_ys = [line.y for line in lines]
             if open_entry:
-                for line in lines:
-                    if line["y"] >= first_start_y:
-                        continue
-                    x = line["x"]
-                    txt = line["text"]
+                for line in lines[: bisect.bisect_left(line_ys, starts[0].y)]:
+                    x = line.x
+                    txt = line.text
                     open_entry["raw_lines"].append(txt)
                     if 70 <= x < 200:
                         open_entry["case_lines"].append(txt)
@@ -289,22 +308,22 @@ def parse_cause_list_pdf(pdf_path: str) -> List[Dict[str, Any]]:
                 entries.append(_parse_single_cause_list_entry(open_entry))
                 open_entry = None
 
+            cuts = [bisect.bisect_left(line_ys, start.y) for start in starts]
+            cuts.append(len(lines))
+            page_no = page_idx + 1
+
             for idx, start in enumerate(starts):
-                y_start = start["y"]
-                y_end = starts[idx + 1]["y"] if idx + 1 < len(starts) else float("inf")
                 segment = {
-                    "item_no": start["text"],
-                    "page_no": page_idx + 1,
+                    "item_no": start.text,
+                    "page_no": page_no,
                     "raw_lines": [],
                     "case_lines": [],
                     "party_lines": [],
                     "advocate_lines": [],
                 }
-                for line in lines:
-                    if not (y_start <= line["y"] < y_end):
-                        continue
-                    x = line["x"]
-                    txt = line["text"]
+                for line in lines[cuts[idx] : cuts[idx + 1]]:
+                    x = line.x
+                    txt = line.text
                     segment["raw_lines"].append(txt)
                     if 70 <= x < 200:
                         segment["case_lines"].append(txt)
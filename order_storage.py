@@ -8,12 +8,14 @@ from typing import Callable, Optional, Union, List, Dict
 from urllib import parse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from supabase import Client, create_client
 
 logger = logging.getLogger(__name__)
 
 ORDER_STORAGE_BUCKET = os.getenv("ORDER_STORAGE_BUCKET", "documents")
+ORDER_DOWNLOAD_CONCURRENCY = int(os.getenv("ORDER_DOWNLOAD_CONCURRENCY", "8"))
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
@@ -26,11 +28,23 @@ def get_supabase_client() -> Optional[Client]:
         return None
 
 
+# Orders are fetched ORDER_DOWNLOAD_CONCURRENCY at a time, mostly from the
+# same court host; a shared pooled session reuses their kept-alive connections.
+_fetch_session = requests.Session()
+_fetch_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=max(32, ORDER_DOWNLOAD_CONCURRENCY),
+    max_retries=0,
+)
+_fetch_session.mount("https://", _fetch_adapter)
+_fetch_session.mount("http://", _fetch_adapter)
+
+
 def _default_fetch(order_url: str, referer: Optional[str] = None) -> requests.Response:
     headers = {}
     if referer:
         headers["Referer"] = referer
-    return requests.get(order_url, timeout=30, headers=headers)
+    return _fetch_session.get(order_url, timeout=30, headers=headers)
 
 
 def _format_order_timestamp(order_date: Optional[Union[str, datetime]]) -> str:
@@ -145,6 +159,17 @@ def _upload_order_document(
     return None
 
 
+def _order_source_url(order: dict, base_url: Optional[str]) -> Optional[str]:
+    raw_url = (
+        order.get("document_url")
+        or order.get("source_document_url")
+        or order.get("orderurlpath")
+    )
+    if raw_url and base_url and raw_url.startswith("/"):
+        raw_url = parse.urljoin(base_url, raw_url)
+    return raw_url
+
+
 def _slugify_folder_name(value: str) -> str:
     slug = "".join(ch if ch.isalnum() else "-" for ch in value.lower().strip())
     slug = "-".join(filter(None, slug.split("-")))
@@ -167,48 +192,41 @@ async def persist_orders_to_storage(
     supabase_client = get_supabase_client()
     processed_orders: list[dict] = []
 
-    loop = asyncio.get_running_loop()
-    tasks = []
-
-    for idx, order in enumerate(orders):
-        raw_url = (
-            order.get("document_url")
-            or order.get("source_document_url")
-            or order.get("orderurlpath")
-        )
-        if raw_url and base_url and raw_url.startswith("/"):
-            raw_url = parse.urljoin(base_url, raw_url)
+    raw_urls = [_order_source_url(order, base_url) for order in orders]
+
+    if supabase_client:
+        loop = asyncio.get_running_loop()
+        # Bound in-flight downloads so a case with many orders does not
+        # monopolize the default executor or the scraper's connection pool.
+        semaphore = asyncio.Semaphore(ORDER_DOWNLOAD_CONCURRENCY)
+
+        async def _store(idx: int, order: dict, raw_url: Optional[str]) -> Optional[dict]:
+            if not raw_url:
+                return None
+            async with semaphore:
+                return await loop.run_in_executor(
+                    None,
+                    _upload_order_document,
+                    raw_url,
+                    idx,
+                    case_id,
+                    order.get("date"),
+                    supabase_client,
+                    fetch_fn,
+                    referer,
+                )
 
-        if supabase_client:
-            task = loop.run_in_executor(
-                None,
-                _upload_order_document,
-                raw_url,
-                idx,
-                case_id,
-                order.get("date"),
-                supabase_client,
-                fetch_fn,
-                referer,
+        stored_results = await asyncio.gather(
+            *(
+                _store(idx, order, raw_url)
+                for idx, (order, raw_url) in enumerate(zip(orders, raw_urls))
             )
-            tasks.append(task)
-        else:
-            future = loop.create_future()
-            future.set_result(None)
-            tasks.append(future)
-
-    stored_results = await asyncio.gather(*tasks)
-
-    for order, stored_result in zip(orders, stored_results):
-        updated_order = dict(order)
-        raw_url = (
-            order.get("document_url")
-            or order.get("source_document_url")
-            or order.get("orderurlpath")
         )
-        if raw_url and base_url and raw_url.startswith("/"):
-            raw_url = parse.urljoin(base_url, raw_url)
+    else:
+        stored_results = [None] * len(orders)
 
+    for order, raw_url, stored_result in zip(orders, raw_urls, stored_results):
+        updated_order = dict(order)
         if stored_result and stored_result.get("public_url"):
             updated_order["source_document_url"] = raw_url
             updated_order["document_url"] = stored_result.get("public_url")
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from dataclasses import asdict
 from typing import List, Optional
 
 from fastapi import APIRouter, Body, HTTPException
@@ -25,9 +27,9 @@ from .hc_services import hc_get_benches, hc_get_case_types, hc_get_states
 from .NCLAT import (nclat_get_details, nclat_search_by_case_no,
                     nclat_search_by_free_text)
 from .NCLAT import persist_orders_to_storage as nclat_persist_orders_to_storage
-from .NCLT import (nclt_get_details, nclt_search_by_advocate_name,
-                   nclt_search_by_case_number, nclt_search_by_filing_number,
-                   nclt_search_by_party_name)
+from .NCLT import (decode_original, nclt_get_details,
+                   nclt_search_by_advocate_name, nclt_search_by_case_number,
+                   nclt_search_by_filing_number, nclt_search_by_party_name)
 from .NCLT import persist_orders_to_storage as nclt_persist_orders_to_storage
 from .SCI import (sci_get_details, sci_search_by_aor_code,
                   sci_search_by_case_number, sci_search_by_court,
@@ -35,66 +37,85 @@ from .SCI import (sci_get_details, sci_search_by_aor_code,
 
 router = APIRouter(prefix="/ecourts", tags=["ecourts"])
 
+# The scrapers block on captcha OCR, HTTP and tenacity's retry sleeps; the
+# endpoints run them on a worker thread so one slow search does not stall
+# every other request on the event loop.
 
 
 @router.get("/search_nclat_search_by_case_no/")
 async def search_nclat_search_by_case_no(location: str, case_type: str, case_no: str, case_year: str):
-    return nclat_search_by_case_no(location, case_type, case_no, case_year)
+    return await asyncio.to_thread(
+        nclat_search_by_case_no, location, case_type, case_no, case_year
+    )
 
 
 @router.get("/search_nclat_search_by_free_text/")
 async def search_nclat_search_by_free_text(
     location: str, search_by: str, free_text: str, from_date: str, to_date: str
 ):
-    return nclat_search_by_free_text(location, search_by, free_text, from_date, to_date)
+    return await asyncio.to_thread(
+        nclat_search_by_free_text, location, search_by, free_text, from_date, to_date
+    )
 
 
 @router.get("/search_nclt_search_by_filing_number/")
 async def search_nclt_search_by_filing_number(bench: str, filing_number: str):
-    return nclt_search_by_filing_number(bench, filing_number)
+    rows = await asyncio.to_thread(nclt_search_by_filing_number, bench, filing_number)
+    return [row._asdict() for row in rows]
 
 
 @router.get("/search_nclt_search_by_case_number/")
 async def search_nclt_search_by_case_number(
     bench: str, case_type: str, case_number: str, case_year: str
 ):
-    return nclt_search_by_case_number(bench, case_type, case_number, case_year)
+    rows = await asyncio.to_thread(
+        nclt_search_by_case_number, bench, case_type, case_number, case_year
+    )
+    return [row._asdict() for row in rows]
 
 
 @router.get("/search_nclt_search_by_party_name/")
 async def search_nclt_search_by_party_name(
     bench: str, party_type: str, party_name: str, case_year: str, case_status: str
 ):
-    return nclt_search_by_party_name(
-        bench, party_type, party_name, case_year, case_status
+    rows = await asyncio.to_thread(
+        nclt_search_by_party_name, bench, party_type, party_name, case_year, case_status
     )
+    return [row._asdict() for row in rows]
 
 
 @router.get("/search_nclt_search_by_advocate_name/")
 async def search_nclt_search_by_advocate_name(bench: str, advocate_name: str, year: str):
-    return nclt_search_by_advocate_name(bench, advocate_name, year)
+    rows = await asyncio.to_thread(nclt_search_by_advocate_name, bench, advocate_name, year)
+    return [row._asdict() for row in rows]
 
 
 @router.get("/search_sci_search_by_diary_number/")
 async def search_sci_search_by_diary_number(diary_number: str, diary_year: str):
-    return sci_search_by_diary_number(diary_number, diary_year)
+    return await asyncio.to_thread(sci_search_by_diary_number, diary_number, diary_year)
 
 
 @router.get("/search_sci_search_by_case_number/")
 async def search_sci_search_by_case_number(case_type: str, case_number: str, case_year: str):
-    return sci_search_by_case_number(case_type, case_number, case_year)
+    return await asyncio.to_thread(
+        sci_search_by_case_number, case_type, case_number, case_year
+    )
 
 
 @router.get("/search_sci_search_by_aor_code/")
 async def search_sci_search_by_aor_code(party_type: str, aor_code: str, year: str, case_status: str):
-    return sci_search_by_aor_code(party_type, aor_code, year, case_status)
+    return await asyncio.to_thread(
+        sci_search_by_aor_code, party_type, aor_code, year, case_status
+    )
 
 
 @router.get("/search_sci_search_by_party_name/")
 async def search_sci_search_by_party_name(
     party_type: str, party_name: str, year: str, party_status: str
 ):
-    return sci_search_by_party_name(party_type, party_name, year, party_status)
+    return await asyncio.to_thread(
+        sci_search_by_party_name, party_type, party_name, year, party_status
+    )
 
 
 @router.get("/search_sci_search_by_court/")
@@ -107,41 +128,56 @@ async def search_sci_search_by_court(
     case_year: str,
     order_date: str,
 ):
-    return sci_search_by_court(
-        court, state, bench, case_type, case_number, case_year, order_date
+    return await asyncio.to_thread(
+        sci_search_by_court,
+        court,
+        state,
+        bench,
+        case_type,
+        case_number,
+        case_year,
+        order_date,
     )
 
 
 @router.get("/nclt_details/")
-async def nclt_details(bench: str, filing_no: str):
+async def nclt_details(bench: str, filing_no: str, include_raw: bool = False):
     if not bench or not filing_no:
         return HTTPException(status_code=400, detail="bench and filing_no are required")
-    return nclt_get_details(bench, filing_no)
+    details = asdict(
+        await asyncio.to_thread(nclt_get_details, bench, filing_no, include_raw=include_raw)
+    )
+    raw = details.pop("original_json_bytes", None)
+    if include_raw:
+        details["original_json"] = decode_original(raw)
+    return details
 
 
 @router.get("/sci_details/")
 async def sci_details(diary_no: str, diary_year: str):
-    return sci_get_details(diary_no, diary_year)
+    return await asyncio.to_thread(sci_get_details, diary_no, diary_year)
 
 
 @router.get("/bombay_hc_details/", summary="Fetch Bombay High Court case details")
 async def bombay_hc_details(case_type: str, case_no: str, case_year: str):
-    return get_bombay_case_details(case_type, case_no, case_year)
+    return await asyncio.to_thread(get_bombay_case_details, case_type, case_no, case_year)
 
 
 @router.get("/gujarat_hc_details/", summary="Fetch Gujarat High Court case details")
 async def gujarat_hc_details(case_type: str, case_no: str, case_year: str):
-    return get_gujarat_case_details(case_type, case_no, case_year)
+    return await asyncio.to_thread(get_gujarat_case_details, case_type, case_no, case_year)
 
 
 @router.get("/gujarat_hc_details_by_filing_no/", summary="Fetch Gujarat High Court case details by filing number")
 async def gujarat_hc_details_by_filing_no(case_type: str, filing_no: str, filing_year: str):
-    return get_gujarat_case_details_by_filing_no(case_type, filing_no, filing_year)
+    return await asyncio.to_thread(
+        get_gujarat_case_details_by_filing_no, case_type, filing_no, filing_year
+    )
 
 
 @router.get("/gujarat_hc_details_by_cnr_no/", summary="Fetch Gujarat High Court case details by CNR number")
 async def gujarat_hc_details_by_cnr_no(cnr_no: str):
-    return get_gujarat_case_details_by_cnr_no(cnr_no)
+    return await asyncio.to_thread(get_gujarat_case_details_by_cnr_no, cnr_no)
 
 
 
@@ -155,12 +191,13 @@ async def hc_search_by_case_number(
     year: str,
 ):
     if state_code is not None and state_code == '15':
-        return get_bombay_case_details(case_type, case_no, year)
+        return await asyncio.to_thread(get_bombay_case_details, case_type, case_no, year)
     if state_code is not None and state_code == '17':
-        return get_gujarat_case_details(case_type, case_no, year)
+        return await asyncio.to_thread(get_gujarat_case_details, case_type, case_no, year)
     if state_code is not None and state_code == '26':
-        return get_delhi_case_details(case_type, case_no, year)
-    return hc_services.hc_search_by_case_number(
+        return await asyncio.to_thread(get_delhi_case_details, case_type, case_no, year)
+    return await asyncio.to_thread(
+        hc_services.hc_search_by_case_number,
         state_code=state_code,
         court_code=court_code,
         case_type=case_type,
@@ -176,7 +213,8 @@ async def hc_search_by_party_name(
     pet_name: str | None = None,
     res_name: str | None = None,
 ):
-    return hc_services.hc_search_by_party_name(
+    return await asyncio.to_thread(
+        hc_services.hc_search_by_party_name,
         state_code=state_code,
         court_code=court_code,
         pet_name=pet_name,
@@ -188,18 +226,19 @@ async def hc_search_by_party_name(
 async def hc_search_by_cnr(cnr_number: str):
     if cnr_number and cnr_number.startswith("GJHC"):
         try:
-            res = get_gujarat_case_details_by_cnr_no(cnr_number)
+            res = await asyncio.to_thread(get_gujarat_case_details_by_cnr_no, cnr_number)
             if res:
                 return res
         except Exception as e:
             logger.warning(f"Direct Gujarat HC search failed for CNR {cnr_number}: {e}")
             
-    return hc_services.hc_search_by_cnr(cnr_number)
+    return await asyncio.to_thread(hc_services.hc_search_by_cnr, cnr_number)
 
 
 @router.get("/hc/case_details/", summary="Get High Court case details")
 async def hc_case_details(state_code: str, court_code: str, case_id: str):
-    return hc_services.hc_get_case_details(
+    return await asyncio.to_thread(
+        hc_services.hc_get_case_details,
         state_code=state_code,
         court_code=court_code,
         case_id=case_id,